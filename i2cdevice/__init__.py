@@ -1,3 +1,4 @@
+import time
 from collections import namedtuple
 
 __version__ = "1.0.0"
@@ -71,6 +72,12 @@ class MockSMBus:
     def read_i2c_block_data(self, i2c_address, register, length):
         return self.regs[register:register + length]
 
+    def write_byte_data(self, i2c_address, register, value):
+        self.regs[register] = value
+
+    def read_byte_data(self, i2c_address, register):
+        return self.regs[register]
+
 
 class _RegisterProxy(object):
     """Register Proxy
@@ -112,21 +119,131 @@ class _RegisterProxy(object):
         self.device.unlock_register(self.register.name)
 
 
+class Bank():
+    """Store information about a register bank/page and how to select it
+
+    :param register: Name of the bank/page select register
+    :param value: Value which selects this bank
+    :param field: Optional name of the field within the select register which holds the bank, by default the whole register is written
+
+    """
+    def __init__(self, register, value, field=None):
+        self.register = register
+        self.value = value
+        self.field = field
+
+
+class _MemoryProxy(object):
+    """Memory Proxy
+
+    Allows device.region_name.read(offset, length) style access to a device's memory regions.
+
+    """
+    def __init__(self, device, region):
+        self.device = device
+        self.region = region
+
+    def read(self, offset=0, length=None):
+        return self.device.read_memory(self.region.name, offset, length)
+
+    def write(self, offset, data):
+        return self.device.write_memory(self.region.name, offset, data)
+
+    def stream(self, offset=0, length=None, chunk_size=None):
+        return self.device.stream_memory(self.region.name, offset, length, chunk_size)
+
+
+class Addressing():
+    """Store how a device addresses multi-byte registers and block transfers
+
+    Set on a Device to apply to all of its registers, or on a Register to override the device.
+
+    :param auto_increment: Bits to set in the register address for the device to auto-increment across a multi-byte transfer, eg: 0x80
+    :param endianness: Byte order of multi-byte registers, 'big' or 'little'
+    :param block: Set to False if the device does not support block transfers, registers are then transferred one byte at a time
+
+    """
+    def __init__(self, auto_increment=0, endianness='big', block=True):
+        if endianness not in ('big', 'little'):
+            raise ValueError("endianness must be 'big' or 'little'")
+        self.auto_increment = auto_increment
+        self.endianness = endianness
+        self.block = block
+
+    def _key(self):
+        return (self.auto_increment, self.endianness, self.block)
+
+    def __eq__(self, other):
+        if not isinstance(other, Addressing):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self._key())
+
+
 class Register():
     """Store information about an i2c register"""
-    def __init__(self, name, address, fields=None, bit_width=8, read_only=False, volatile=True):
+    def __init__(self, name, address, fields=None, bit_width=8, read_only=False, volatile=True, bank=None, addressing=None):
         self.name = name
         self.address = address
         self.bit_width = bit_width
         self.read_only = read_only
         self.volatile = volatile
+        self.bank = bank
+        self.addressing = addressing
         self.is_read = False
         self.fields = {}
 
         for field in fields:
             self.fields[field.name] = field
+            field.shift = _trailing_zeros(field.mask, self.bit_width)
+
+        self._namedtuple = None
 
-        self.namedtuple = namedtuple(self.name, sorted(self.fields))
+    @property
+    def namedtuple(self):
+        # Created on first use, since building namedtuple classes dominates the cost of declaring large register maps
+        if self._namedtuple is None:
+            self._namedtuple = namedtuple(self.name, sorted(self.fields))
+        return self._namedtuple
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_namedtuple'] = None
+        return state
+
+
+class MemoryRegion():
+    """Store information about a block of byte-addressed memory, such as an EEPROM or FRAM
+
+    :param name: Name of the memory region
+    :param address: Word address of the start of the region
+    :param size: Size of the region in bytes
+    :param address_width: Width of the word address, 8 or 16 bits. Address bits beyond this are carried in the i2c address, as used by 24C04-24C16 parts
+    :param page_size: Write page size in bytes, writes are split so they never cross a page boundary
+    :param block_size: Maximum number of data bytes in a single SMBus block transfer
+    :param read_size: Maximum number of bytes in a single read when the bus supports combined i2c_rdwr transfers
+    :param write_timeout: Time in seconds to poll for the end of each write cycle, or None if writes complete immediately (FRAM)
+    :param read_only: Set to prevent writes
+
+    """
+    def __init__(self, name, address=0, size=256, address_width=8, page_size=None, block_size=32, read_size=4096, write_timeout=None, read_only=False):
+        if address_width not in (8, 16):
+            raise ValueError("{}: address_width must be 8 or 16".format(name))
+        self.name = name
+        self.address = address
+        self.size = size
+        self.address_width = address_width
+        self.page_size = page_size
+        self.block_size = block_size
+        self.read_size = read_size
+        self.write_timeout = write_timeout
+        self.read_only = read_only
 
 
 class BitField():
@@ -138,26 +255,77 @@ class BitField():
         self.bit_width = bit_width
         self.read_only = read_only
 
+        self._compile_adapter()
+
+    def _compile_adapter(self):
+        # Resolve the adapter to plain functions up front, built-in adapters supply specialised ones
+        self._decoder = self._encoder = None
+        if self.adapter is not None:
+            if hasattr(self.adapter, '_compile'):
+                self._decoder, self._encoder = self.adapter._compile()
+            else:
+                self._decoder, self._encoder = self.adapter._decode, self.adapter._encode
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_decoder']
+        del state['_encoder']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile_adapter()
+
 
 class BitFlag(BitField):
     def __init__(self, name, bit, read_only=False):
         BitField.__init__(self, name, 1 << bit, adapter=None, bit_width=8, read_only=read_only)
 
 
+class _Subscription(object):
+    """Store a change subscription and the register value it last saw at each address"""
+    __slots__ = ('mask', 'fields', 'callback', 'last')
+
+    def __init__(self, mask, fields, callback):
+        self.mask = mask
+        self.fields = fields
+        self.callback = callback
+        self.last = {}
+
+
 class Device(object):
-    def __init__(self, i2c_address, i2c_dev=None, bit_width=8, registers=None):
+    def __init__(self, i2c_address, i2c_dev=None, bit_width=8, registers=None, regions=None, addressing=None):
         self._bit_width = bit_width
+        self._addressing = Addressing() if addressing is None else addressing
 
         self.locked = {}
         self.registers = {}
-        self.values = {}
+        self.regions = {}
+
+        self._bank_selects = set()
+        self._subscriptions = {}
+
+        # Access pattern tracking for adaptive prefetch, see enable_prefetch
+        self._prefetch_enabled = False
+        self._prefetch_frozen = False
+        self._prefetch_threshold = 3
+        self._prefetch_plan = {}
+        self._prefetch_history = {}
+        self._prefetch_cycle = []
+        self._prefetched = set()
+        self._prefetching = False
 
         if isinstance(i2c_address, list):
             self._i2c_addresses = i2c_address
-            self._i2c_address = i2c_address[0]
         else:
             self._i2c_addresses = [i2c_address]
-            self._i2c_address = i2c_address
+
+        # Each address has its own shadow values, selected banks (last known value of each
+        # bank select register) and set of registers whose shadow value reflects the device
+        self._address_state = {}
+        for address in self._i2c_addresses:
+            self._address_state[address] = ({}, {}, set())
+        self._set_address(self._i2c_addresses[0])
 
         self._i2c = i2c_dev
 
@@ -165,11 +333,29 @@ class Device(object):
             import smbus2
             self._i2c = smbus2.SMBus(1)
 
-        for register in registers:
+        for register in registers or ():
             self.locked[register.name] = False
-            self.values[register.name] = 0
+            for values, _, _ in self._address_state.values():
+                values[register.name] = 0
             self.registers[register.name] = register
             self.__dict__[register.name] = _RegisterProxy(self, register)
+            if register.bank is not None:
+                self._bank_selects.add(register.bank.register)
+
+        for register in self.registers.values():
+            bank = register.bank
+            if bank is None:
+                continue
+            if bank.register not in self.registers:
+                raise ValueError("{}: unknown bank register {}".format(register.name, bank.register))
+            if bank.field is not None and bank.field not in self.registers[bank.register].fields:
+                raise ValueError("{}: unknown bank field {}.{}".format(register.name, bank.register, bank.field))
+            if self.registers[bank.register].bank is not None:
+                raise ValueError("{}: bank register {} cannot itself be banked".format(register.name, bank.register))
+
+        for region in regions or ():
+            self.regions[region.name] = region
+            self.__dict__[region.name] = _MemoryProxy(self, region)
 
     def lock_register(self, name):
         self.locked[name] = True
@@ -179,21 +365,311 @@ class Device(object):
 
     def read_register(self, name):
         register = self.registers[name]
-        if register.volatile or not register.is_read:
-            self.values[register.name] = self._i2c_read(register.address, register.bit_width)
-            register.is_read = True
+        if register.volatile or register.name not in self._shadowed:
+            if self._prefetch_enabled and not self._prefetching and self._prefetch_access(register.name):
+                return self.values[register.name]
+            self.select_bank(register.name)
+            self._register_read(register, self._i2c_read(register.address, register.bit_width, self._get_addressing(register)))
         return self.values[register.name]
 
     def write_register(self, name):
         register = self.registers[name]
-        return self._i2c_write(register.address, self.values[register.name], register.bit_width)
+        self.select_bank(register.name)
+        result = self._i2c_write(register.address, self.values[register.name], register.bit_width, self._get_addressing(register))
+        self._register_written(register)
+        return result
+
+    def enable_prefetch(self, threshold=3, plan=None):
+        """Learn which registers are read together, and prefetch them in a single block read.
+
+        A sampling cycle ends when a register already read during the cycle is read again.
+        Once the same registers have followed the cycle's first register for threshold cycles
+        in a row, reading that register prefetches them all, and their next reads are served
+        from the prefetched values.
+
+        :param threshold: Number of matching cycles needed before prefetching
+        :param plan: Optional plan, as returned by get_prefetch_plan, to start with
+
+        """
+        if threshold < 1:
+            raise ValueError("threshold must be at least 1")
+        if plan is not None:
+            plan = dict((trigger, tuple(names)) for trigger, names in plan.items())
+            for trigger, names in plan.items():
+                for name in (trigger,) + names:
+                    if name not in self.registers:
+                        raise ValueError("{}: unknown register in prefetch plan".format(name))
+            self._prefetch_plan = plan
+        self._prefetch_enabled = True
+        self._prefetch_threshold = threshold
+
+    def disable_prefetch(self):
+        """Stop prefetching and forget the learned plan."""
+        self._prefetch_enabled = False
+        self._prefetch_frozen = False
+        self._prefetch_plan = {}
+        self._prefetch_history = {}
+        self._prefetch_cycle = []
+        self._prefetched = set()
+
+    def freeze_prefetch(self, frozen=True):
+        """Stop (or resume) learning, keeping the current prefetch plan.
+
+        :param frozen: Set to False to resume learning
+
+        """
+        self._prefetch_frozen = frozen
+
+    def get_prefetch_plan(self):
+        """Get the learned prefetch plan.
+
+        Returns a dictionary of trigger register name to a tuple of the register names prefetched when it is read.
+
+        """
+        return dict(self._prefetch_plan)
+
+    def _prefetch_access(self, name):
+        """Track a register read, returning True if it has been served from prefetched values."""
+        if name in self._prefetched:
+            self._prefetched.discard(name)
+            self._prefetch_cycle.append(name)
+            return True
+
+        if name in self._prefetch_cycle:
+            self._end_prefetch_cycle()
+        self._prefetch_cycle.append(name)
+
+        plan = self._prefetch_plan.get(name)
+        if not plan:
+            return False
+
+        # The trigger is always part of the read, even if a supplied plan leaves it out,
+        # while locked registers are left out so their pending changes aren't overwritten
+        plan = (name,) + tuple(other for other in plan if other != name and not self.locked[other])
+
+        self._prefetching = True
+        try:
+            self.read_registers(plan)
+        finally:
+            self._prefetching = False
+        self._prefetched = set(plan)
+        self._prefetched.discard(name)
+        return True
+
+    def _end_prefetch_cycle(self):
+        cycle = self._prefetch_cycle
+        self._prefetch_cycle = []
+        self._prefetched = set()
+        if self._prefetch_frozen:
+            return
+
+        trigger = cycle[0]
+        history = self._prefetch_history.setdefault(trigger, [])
+        history.append(set(cycle))
+        del history[:-self._prefetch_threshold]
+        if len(history) < self._prefetch_threshold:
+            return
+
+        common = set.intersection(*history)
+        if len(common) > 1:
+            self._prefetch_plan[trigger] = tuple(name for name in dict.fromkeys(cycle) if name in common)
+        else:
+            self._prefetch_plan.pop(trigger, None)
+
+    def read_registers(self, names):
+        """Read several registers, coalescing contiguous registers into block reads.
+
+        :param names: Names of registers to read
+
+        """
+        for run in self._plan_bursts(names):
+            first = run[0]
+            addressing = self._get_addressing(first)
+            self.select_bank(first.name)
+            length = sum(self._register_length(register) for register in run)
+            data = bytearray(self._i2c_read_block(first.address, length, addressing))
+            offset = 0
+            for register in run:
+                register_length = self._register_length(register)
+                self._register_read(register, int.from_bytes(data[offset:offset + register_length], addressing.endianness))
+                offset += register_length
+        return dict((name, self.values[name]) for name in names)
+
+    def write_registers(self, names):
+        """Write the shadow values of several registers, coalescing contiguous registers into block writes.
+
+        :param names: Names of registers to write
+
+        """
+        for run in self._plan_bursts(names):
+            self._write_run(run)
+
+    def _write_run(self, run):
+        first = run[0]
+        addressing = self._get_addressing(first)
+        self.select_bank(first.name)
+        data = []
+        for register in run:
+            data += list(_int_to_bytes(self.values[register.name], self._register_length(register), addressing.endianness))
+        self._i2c_write_block(first.address, data, addressing)
+        for register in run:
+            self._register_written(register)
+
+    def _register_read(self, register, value):
+        """Store a value read from the device."""
+        self.values[register.name] = value
+        self._shadowed.add(register.name)
+        register.is_read = True
+        if register.name in self._bank_selects:
+            self._banks[register.name] = value
+        if register.name in self._subscriptions:
+            self._notify(register, value)
+
+    def subscribe(self, register, fields, callback):
+        """Call back with the fields of a register which change between reads.
+
+        After each read of the register the changed fields are decoded and passed to the callback
+        as callback(register, {field: value}). The first read reports every subscribed field.
+        Changes are tracked separately for each address, and reported while that address is selected.
+
+        :param register: Name of register to watch
+        :param fields: Names of fields to watch, or None for all fields
+        :param callback: Function to call with changed fields
+
+        """
+        fields = [self.registers[register].fields[field] for field in (fields or self.registers[register].fields)]
+        mask = 0
+        for field in fields:
+            mask |= field.mask
+        self._subscriptions.setdefault(register, []).append(_Subscription(mask, fields, callback))
+
+    def unsubscribe(self, register, callback):
+        """Stop calling back with changes to a register.
+
+        :param register: Name of register to stop watching
+        :param callback: Function previously passed to subscribe
+
+        """
+        subscriptions = [s for s in self._subscriptions.get(register, []) if s.callback != callback]
+        if subscriptions:
+            self._subscriptions[register] = subscriptions
+        else:
+            self._subscriptions.pop(register, None)
+
+    def _notify(self, register, value):
+        address = self._i2c_address
+        for subscription in self._subscriptions[register.name]:
+            last = subscription.last.get(address)
+            subscription.last[address] = value
+            if last is None:
+                changed = subscription.mask
+            else:
+                changed = (value ^ last) & subscription.mask
+                if not changed:
+                    continue
+            subscription.callback(register.name, dict(
+                (field.name, self._decode_field(register, field, value))
+                for field in subscription.fields if changed & field.mask))
+
+    def _register_written(self, register):
+        """Record that a register's shadow value has been written to the device."""
+        self._shadowed.add(register.name)
+        if register.name in self._bank_selects:
+            self._banks[register.name] = self.values[register.name]
+        # A write can change other registers too, eg: clearing interrupt flags, so no prefetched value can be trusted
+        self._prefetched = set()
+
+    def _register_length(self, register):
+        return register.bit_width // self._bit_width
+
+    def _plan_bursts(self, names, max_length=32):
+        """Group registers into runs which can each be transferred in a single block read or write.
+
+        A run shares one bank and addressing policy, and covers contiguous addresses. Unbanked registers
+        come first, then the currently selected bank(s), then the rest, so each bank is switched to at most once.
+        Registers whose addressing policy does not allow block transfers are each given a run of their own.
+
+        :param names: Names of registers to plan
+        :param max_length: Maximum number of bytes in a single transfer
+
+        """
+        groups = {}
+        for name in dict.fromkeys(names):
+            register = self.registers[name]
+            bank = register.bank
+            key = (None if bank is None else (bank.register, bank.field, bank.value), self._get_addressing(register))
+            groups.setdefault(key, []).append(register)
+
+        # Keep groups for the same bank together, whatever their addressing policy
+        banks = list(dict.fromkeys(key[0] for key in groups))
+
+        def bank_order(key):
+            if key[0] is None:
+                return 0, 0
+            bank = groups[key][0].bank
+            value = self._bank_value(bank)
+            return 1 if value is not None and self._banks.get(bank.register) == value else 2, banks.index(key[0])
+
+        runs = []
+        for key in sorted(groups, key=bank_order):
+            block = key[1].block
+            run = []
+            end = length = None
+            for register in sorted(groups[key], key=lambda register: register.address):
+                register_length = self._register_length(register)
+                if block and run and register.address == end and length + register_length <= max_length:
+                    run.append(register)
+                    length += register_length
+                else:
+                    run = [register]
+                    runs.append(run)
+                    length = register_length
+                end = register.address + register_length
+        return runs
+
+    def select_bank(self, name):
+        """Select the bank/page containing a register.
+
+        The select register is only written if the bank differs from the last one selected.
+
+        :param name: Name of the banked register to select
+
+        """
+        bank = self.registers[name].bank
+        if bank is None:
+            return
+        select = self.registers[bank.register]
+
+        value = self._bank_value(bank)
+        if value is None:
+            self.read_register(select.name)
+            value = self._bank_value(bank)
+
+        if self._banks.get(select.name) != value:
+            self.values[select.name] = value
+            self.write_register(select.name)
+
+    def _bank_value(self, bank):
+        """Get the select register value for a bank, or None if it depends on an unknown select register value."""
+        if bank.field is None:
+            return bank.value
+        select = self.registers[bank.register]
+        if select.name not in self._banks:
+            return None
+        field = select.fields[bank.field]
+        value = self._banks[select.name] & ~field.mask
+        return value | (bank.value << field.shift) & field.mask
+
+    def invalidate_banks(self):
+        """Forget the selected banks, eg: after a device reset, so the next banked access re-selects."""
+        self._banks.clear()
 
     def get_addresses(self):
         return self._i2c_addresses
 
     def select_address(self, address):
         if address in self._i2c_addresses:
-            self._i2c_address = address
+            self._set_address(address)
             return True
         raise ValueError("Address {:02x} invalid!".format(address))
 
@@ -201,9 +677,65 @@ class Device(object):
         next_addr = self._i2c_addresses.index(self._i2c_address)
         next_addr += 1
         next_addr %= len(self._i2c_addresses)
-        self._i2c_address = self._i2c_addresses[next_addr]
+        self._set_address(self._i2c_addresses[next_addr])
         return self._i2c_address
 
+    def _set_address(self, address):
+        self._i2c_address = address
+        self._prefetched = set()
+        self.values, self._banks, self._shadowed = self._address_state[address]
+
+    def get_all(self, register):
+        """Get a namedtuple of register fields from every address.
+
+        Returns a dictionary of address to namedtuple.
+
+        :param register: Name of register to retrieve
+
+        """
+        register = self.registers[register]
+        fields = list(register.fields.values())
+        address = self._i2c_address
+        result = {}
+        try:
+            for each in self._i2c_addresses:
+                self._set_address(each)
+                value = self.read_register(register.name)
+                result[each] = register.namedtuple(**dict(
+                    (field.name, self._decode_field(register, field, value)) for field in fields))
+        finally:
+            self._set_address(address)
+        return result
+
+    def set_all(self, register, **kwargs):
+        """Write one or more fields on a device register at every address.
+
+        Accepts multiple keyword arguments, one for each field to write.
+
+        :param register: Name of register to write.
+
+        """
+        register = self.registers[register]
+        mask = value = 0
+        for field, field_value in kwargs.items():
+            field = register.fields[field]
+            mask |= field.mask
+            value = self._encode_field(register, field, field_value, value)
+        # No need to read the register first if every bit is being replaced
+        full = mask == (1 << register.bit_width) - 1
+
+        address = self._i2c_address
+        try:
+            for each in self._i2c_addresses:
+                self._set_address(each)
+                if full:
+                    self.values[register.name] = value
+                else:
+                    self.values[register.name] = (self.read_register(register.name) & ~mask) | value
+                self.write_register(register.name)
+        finally:
+            self._set_address(address)
+
     def set(self, register, **kwargs):
         """Write one or more fields on a device register.
 
@@ -241,51 +773,272 @@ class Device(object):
         if not self.locked[register.name]:
             self.read_register(register.name)
 
-        value = self.values[register.name]
+        return self._decode_field(register, field, self.values[register.name])
+
+    def set_field(self, register, field, value):
+        register = self.registers[register]
+        field = register.fields[field]
+
+        if not self.locked[register.name]:
+            self.read_register(register.name)
+
+        self.values[register.name] = self._encode_field(register, field, value, self.values[register.name])
 
-        value = (value & field.mask) >> _trailing_zeros(field.mask, register.bit_width)
+        if not self.locked[register.name]:
+            self.write_register(register.name)
 
-        if field.adapter is not None:
+    def _decode_field(self, register, field, reg_value):
+        """Extract a field from a raw register value and translate it through the field's adapter."""
+        value = (reg_value & field.mask) >> field.shift
+
+        if field._decoder is not None:
             try:
-                value = field.adapter._decode(value)
+                value = field._decoder(value)
             except ValueError as value_error:
                 raise ValueError("{}: {}".format(field.name, str(value_error)))
 
         return value
 
-    def set_field(self, register, field, value):
-        register = self.registers[register]
-        field = register.fields[field]
-        shift = _trailing_zeros(field.mask, register.bit_width)
+    def _encode_field(self, register, field, value, reg_value):
+        """Translate a value through the field's adapter and insert it into a raw register value."""
+        if field._encoder is not None:
+            value = field._encoder(value)
 
-        if field.adapter is not None:
-            value = field.adapter._encode(value)
+        reg_value &= ~field.mask
+        reg_value |= (value << field.shift) & field.mask
+        return reg_value
 
-        if not self.locked[register.name]:
-            self.read_register(register.name)
+    def export_profile(self):
+        """Capture the fields of every writable register as a profile.
 
-        reg_value = self.values[register.name]
+        Registers are read in as few block reads as possible. The profile is a plain dictionary
+        of register names to dictionaries of field values, suitable for serialising to JSON.
 
-        reg_value &= ~field.mask
-        reg_value |= (value << shift) & field.mask
+        """
+        names = [name for name, register in self.registers.items() if not register.read_only]
+        self.read_registers(names)
+        profile = {}
+        for name in names:
+            register = self.registers[name]
+            profile[name] = dict(
+                (field.name, self._decode_field(register, field, self.values[name]))
+                for field in register.fields.values() if not field.read_only)
+        return profile
 
-        self.values[register.name] = reg_value
+    def apply_profile(self, profile):
+        """Apply a profile captured by export_profile.
 
-        if not self.locked[register.name]:
-            self.write_register(register.name)
+        Only registers whose value differs from their shadow value are written,
+        and contiguous registers are coalesced into block writes.
+
+        :param profile: Dictionary of register names to dictionaries of field values
+
+        Returns a list of the names of registers which were written.
+
+        """
+        for name, fields in profile.items():
+            register = self.registers[name]
+            if register.read_only:
+                raise ValueError("{}: register is read only".format(name))
+            for field in fields:
+                if register.fields[field].read_only:
+                    raise ValueError("{}.{}: field is read only".format(name, field))
+
+        fresh = set(name for name in profile if name not in self._shadowed)
+        self.read_registers([name for name in profile if name in fresh])
+
+        changed = set()
+        for name, fields in profile.items():
+            register = self.registers[name]
+            value = self.values[name]
+            for field, field_value in fields.items():
+                value = self._encode_field(register, register.fields[field], field_value, value)
+            if value != self.values[name]:
+                self.values[name] = value
+                changed.add(name)
+
+        # Unchanged registers between two changed ones are rewritten with the value they already hold
+        # if that saves starting a new transfer, but only if that value is known to be current
+        bridgeable = set(name for name in profile if name in fresh or not self.registers[name].volatile)
+        for run in self._plan_bursts(profile):
+            segment = []
+            for register in run + [None]:
+                if register is not None and (register.name in changed or (segment and register.name in bridgeable)):
+                    segment.append(register)
+                    continue
+                while segment and segment[-1].name not in changed:
+                    segment.pop()
+                if segment:
+                    self._write_run(segment)
+                segment = []
+
+        return sorted(changed)
 
     def get_register(self, register):
         register = self.registers[register]
-        return self._i2c_read(register.address, register.bit_width)
+        self.select_bank(register.name)
+        return self._i2c_read(register.address, register.bit_width, self._get_addressing(register))
+
+    def read_memory(self, name, offset=0, length=None):
+        """Read bytes from a memory region.
+
+        :param name: Name of memory region to read
+        :param offset: Offset, in bytes, from the start of the region
+        :param length: Number of bytes to read, defaults to the rest of the region
+
+        """
+        region = self.regions[name]
+        if length is None:
+            length = region.size - offset
+        buf = bytearray(length)
+        self.read_memory_into(name, offset, buf)
+        return buf
+
+    def read_memory_into(self, name, offset, buffer):
+        """Read bytes from a memory region into an existing writable buffer.
 
-    def _i2c_write(self, register, value, bit_width):
-        values = _int_to_bytes(value, bit_width // self._bit_width, 'big')
+        :param name: Name of memory region to read
+        :param offset: Offset, in bytes, from the start of the region
+        :param buffer: bytearray, memoryview or other writable buffer to fill
+
+        """
+        buffer = memoryview(buffer).cast('B')
+        position = 0
+        for chunk in self.stream_memory(name, offset, len(buffer)):
+            buffer[position:position + len(chunk)] = chunk
+            position += len(chunk)
+        return position
+
+    def stream_memory(self, name, offset=0, length=None, chunk_size=None):
+        """Iterate over the contents of a memory region, one transfer at a time.
+
+        Only one chunk is held in memory at once, so arbitrarily large regions can be streamed.
+
+        :param name: Name of memory region to read
+        :param offset: Offset, in bytes, from the start of the region
+        :param length: Number of bytes to read, defaults to the rest of the region
+        :param chunk_size: Maximum size of each chunk, defaults to the largest single transfer the bus allows
+
+        """
+        region = self.regions[name]
+        if length is None:
+            length = region.size - offset
+        self._check_memory_bounds(region, offset, length)
+
+        if hasattr(self._i2c, 'i2c_rdwr'):
+            size = region.read_size
+        elif region.address_width == 8:
+            size = region.block_size
+        else:
+            raise IOError("{}: 16-bit addressing requires a bus with i2c_rdwr support".format(region.name))
+
+        if chunk_size is not None:
+            size = min(size, chunk_size)
+
+        # Validation above happens on the call, rather than on the first iteration of a generator
+        def stream():
+            for address, count in self._memory_chunks(region, region.address + offset, length, size):
+                yield self._memory_read(region, address, count)
+
+        return stream()
+
+    def write_memory(self, name, offset, data):
+        """Write bytes to a memory region.
+
+        Writes are split so that no transfer crosses a page or exceeds the SMBus block size,
+        and each is followed by polling for the end of the write cycle if required.
+
+        :param name: Name of memory region to write
+        :param offset: Offset, in bytes, from the start of the region
+        :param data: bytes, bytearray, memoryview or list of values to write
+
+        """
+        region = self.regions[name]
+        if region.read_only:
+            raise ValueError("{}: memory region is read only".format(region.name))
+        data = memoryview(bytes(data) if isinstance(data, list) else data).cast('B')
+        self._check_memory_bounds(region, offset, len(data))
+
+        size = region.block_size - (region.address_width // 8 - 1)
+        position = 0
+        for address, count in self._memory_chunks(region, region.address + offset, len(data), size, region.page_size):
+            i2c_address, word_address = self._memory_target(region, address)
+            self._i2c.write_i2c_block_data(i2c_address, word_address[0], word_address[1:] + list(data[position:position + count]))
+            position += count
+            if region.write_timeout is not None:
+                self._wait_for_write(region, i2c_address)
+
+    def _check_memory_bounds(self, region, offset, length):
+        if offset < 0 or length < 0 or offset + length > region.size:
+            raise ValueError("{}: {} bytes at offset {} out of range".format(region.name, length, offset))
+
+    def _memory_chunks(self, region, address, length, size, page_size=None):
+        """Split a memory access into transfers of at most size bytes which do not cross a page."""
+        # Word addresses wrap (or spill into the i2c address) at 8/16 bits, so never cross that either
+        boundary = 1 << region.address_width
+        if page_size is not None:
+            boundary = min(boundary, page_size)
+        end = address + length
+        while address < end:
+            count = min(size, end - address, boundary - (address % boundary))
+            yield address, count
+            address += count
+
+    def _memory_target(self, region, address):
+        """Get the i2c address and word address bytes for an absolute memory address."""
+        i2c_address = self._i2c_address | (address >> region.address_width)
+        if region.address_width == 8:
+            return i2c_address, [address & 0xff]
+        return i2c_address, [(address >> 8) & 0xff, address & 0xff]
+
+    def _memory_read(self, region, address, count):
+        i2c_address, word_address = self._memory_target(region, address)
+        if hasattr(self._i2c, 'i2c_rdwr'):
+            from smbus2 import i2c_msg
+            write = i2c_msg.write(i2c_address, word_address)
+            read = i2c_msg.read(i2c_address, count)
+            self._i2c.i2c_rdwr(write, read)
+            return bytes(read)
+        return bytes(self._i2c.read_i2c_block_data(i2c_address, word_address[0], count))
+
+    def _wait_for_write(self, region, i2c_address):
+        """Poll the device until it acknowledges, signalling the end of its write cycle."""
+        timeout = time.time() + region.write_timeout
+        while True:
+            try:
+                self._i2c.write_quick(i2c_address)
+                return
+            except IOError:
+                if time.time() > timeout:
+                    raise TimeoutError("{}: timed out waiting for write cycle".format(region.name))
+                time.sleep(0.0005)
+
+    def _get_addressing(self, register):
+        return self._addressing if register.addressing is None else register.addressing
+
+    def _i2c_write(self, register, value, bit_width, addressing=None):
+        addressing = addressing or self._addressing
+        values = _int_to_bytes(value, bit_width // self._bit_width, addressing.endianness)
         values = list(values)
+        self._i2c_write_block(register, values, addressing)
+
+    def _i2c_read(self, register, bit_width, addressing=None):
+        addressing = addressing or self._addressing
+        values = self._i2c_read_block(register, bit_width // self._bit_width, addressing)
+        return int.from_bytes(bytearray(values), addressing.endianness)
+
+    def _i2c_write_block(self, register, values, addressing):
+        if not addressing.block:
+            for offset, value in enumerate(values):
+                self._i2c.write_byte_data(self._i2c_address, register + offset, value)
+            return
+        if len(values) > 1:
+            register |= addressing.auto_increment
         self._i2c.write_i2c_block_data(self._i2c_address, register, values)
 
-    def _i2c_read(self, register, bit_width):
-        value = 0
-        for x in self._i2c.read_i2c_block_data(self._i2c_address, register, bit_width // self._bit_width):
-            value <<= 8
-            value |= x
-        return value
+    def _i2c_read_block(self, register, length, addressing):
+        if not addressing.block:
+            return [self._i2c.read_byte_data(self._i2c_address, register + offset) for offset in range(length)]
+        if length > 1:
+            register |= addressing.auto_increment
+        return self._i2c.read_i2c_block_data(self._i2c_address, register, length)
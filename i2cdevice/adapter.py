@@ -1,6 +1,10 @@
 class Adapter:
     """
     Must implement `_decode()` and `_encode()`.
+
+    May implement `_compile()` to return faster, specialised versions of both.
+    The built-in adapters do, reading their parameters once when the BitField using them is built,
+    so change parameters (other than a LookupAdapter's table) by creating a new adapter.
     """
     def _decode(self, value):
         raise NotImplementedError
@@ -8,6 +12,14 @@ class Adapter:
     def _encode(self, value):
         raise NotImplementedError
 
+    def _compile(self):
+        """Get a (decode, encode) pair of functions used by Device to translate field values."""
+        return self._decode, self._encode
+
+    def _is_builtin(self, cls, *methods):
+        """Check a subclass of cls doesn't override its translation methods, so cls's specialised _compile applies."""
+        return all(getattr(type(self), name) is getattr(cls, name) for name in ('_decode', '_encode') + methods)
+
 
 class LookupAdapter(Adapter):
     """Adaptor with a dictionary of values.
@@ -30,6 +42,27 @@ class LookupAdapter(Adapter):
             value = min(list(self.lookup_table.keys()), key=lambda x: abs(x - value))
         return self.lookup_table[value]
 
+    def _compile(self):
+        if not self._is_builtin(LookupAdapter):
+            return Adapter._compile(self)
+
+        table = self.lookup_table
+        reverse = {}
+        for k, v in table.items():
+            reverse.setdefault(v, k)
+        missing = object()
+
+        def decode(value):
+            # The reverse map is only a hint, checked against the live table, so changes to the table are still seen
+            k = reverse.get(value, missing)
+            if k is not missing and table.get(k, missing) == value:
+                return k
+            k = self._decode(value)
+            reverse[value] = k
+            return k
+
+        return decode, self._encode
+
 
 class U16ByteSwapAdapter(Adapter):
     """Adaptor to swap the bytes in a 16bit integer."""
@@ -41,3 +74,207 @@ class U16ByteSwapAdapter(Adapter):
 
     def _encode(self, value):
         return self._byteswap(value)
+
+    def _compile(self):
+        if not self._is_builtin(U16ByteSwapAdapter, '_byteswap'):
+            return Adapter._compile(self)
+
+        def byteswap(value):
+            return (value >> 8) | ((value & 0xFF) << 8)
+        return byteswap, byteswap
+
+
+class LittleEndianAdapter(Adapter):
+    """Adaptor to reverse the byte order of a multi-byte little-endian value.
+
+    :param length: Length of the value in bytes
+
+    """
+    def __init__(self, length=2):
+        self.length = length
+
+    def _decode(self, value):
+        return int.from_bytes(value.to_bytes(self.length, 'big'), 'little')
+
+    def _encode(self, value):
+        return int.from_bytes(value.to_bytes(self.length, 'little'), 'big')
+
+    def _compile(self):
+        if not self._is_builtin(LittleEndianAdapter):
+            return Adapter._compile(self)
+
+        length = self.length
+
+        def decode(value):
+            return int.from_bytes(value.to_bytes(length, 'big'), 'little')
+
+        def encode(value):
+            return int.from_bytes(value.to_bytes(length, 'little'), 'big')
+
+        return decode, encode
+
+
+class TwosComplementAdapter(Adapter):
+    """Adaptor for signed two's complement values.
+
+    :param bit_width: Width of the value in bits
+
+    """
+    def __init__(self, bit_width=16):
+        self.bit_width = bit_width
+
+    def _decode(self, value):
+        if value & (1 << (self.bit_width - 1)):
+            value -= 1 << self.bit_width
+        return value
+
+    def _encode(self, value):
+        return value & ((1 << self.bit_width) - 1)
+
+    def _compile(self):
+        if not self._is_builtin(TwosComplementAdapter):
+            return Adapter._compile(self)
+
+        sign = 1 << (self.bit_width - 1)
+        mask = (1 << self.bit_width) - 1
+
+        def decode(value):
+            return value - ((value & sign) << 1)
+
+        def encode(value):
+            return value & mask
+
+        return decode, encode
+
+
+class ScaleAdapter(Adapter):
+    """Adaptor for values with a linear scale and offset, ie: real = raw * scale + offset.
+
+    :param scale: Multiplier applied to the raw value
+    :param offset: Offset added after scaling
+
+    """
+    def __init__(self, scale=1, offset=0):
+        self.scale = scale
+        self.offset = offset
+
+    def _decode(self, value):
+        return value * self.scale + self.offset
+
+    def _encode(self, value):
+        return int(round((value - self.offset) / self.scale))
+
+    def _compile(self):
+        if not self._is_builtin(ScaleAdapter):
+            return Adapter._compile(self)
+
+        scale = self.scale
+        offset = self.offset
+
+        if offset == 0:
+            def decode(value):
+                return value * scale
+        else:
+            def decode(value):
+                return value * scale + offset
+
+        def encode(value):
+            return int(round((value - offset) / scale))
+
+        return decode, encode
+
+
+class FixedPointAdapter(Adapter):
+    """Adaptor for fixed-point values.
+
+    :param fractional_bits: Number of bits after the binary point
+    :param bit_width: Width of the value in bits, used when signed
+    :param signed: Set if the value is signed two's complement
+
+    """
+    def __init__(self, fractional_bits, bit_width=16, signed=False):
+        self.fractional_bits = fractional_bits
+        self.bit_width = bit_width
+        self.signed = signed
+
+    def _decode(self, value):
+        if self.signed and value & (1 << (self.bit_width - 1)):
+            value -= 1 << self.bit_width
+        return value / float(1 << self.fractional_bits)
+
+    def _encode(self, value):
+        return int(round(value * (1 << self.fractional_bits))) & ((1 << self.bit_width) - 1)
+
+    def _compile(self):
+        if not self._is_builtin(FixedPointAdapter):
+            return Adapter._compile(self)
+
+        scale = 1.0 / (1 << self.fractional_bits)
+        factor = 1 << self.fractional_bits
+        sign = 1 << (self.bit_width - 1) if self.signed else 0
+        mask = (1 << self.bit_width) - 1
+
+        def decode(value):
+            return (value - ((value & sign) << 1)) * scale
+
+        def encode(value):
+            return int(round(value * factor)) & mask
+
+        return decode, encode
+
+
+class ChainAdapter(Adapter):
+    """Adaptor which applies several adaptors in turn.
+
+    Values are decoded through the adaptors in order, and encoded through them in reverse.
+
+    :param adapters: Adaptors to chain, from the raw register value outwards
+
+    """
+    def __init__(self, *adapters):
+        self.adapters = adapters
+
+    def _decode(self, value):
+        for adapter in self.adapters:
+            value = adapter._decode(value)
+        return value
+
+    def _encode(self, value):
+        for adapter in reversed(self.adapters):
+            value = adapter._encode(value)
+        return value
+
+    def _compile(self):
+        if not self._is_builtin(ChainAdapter):
+            return Adapter._compile(self)
+
+        compiled = [adapter._compile() if hasattr(adapter, '_compile') else (adapter._decode, adapter._encode) for adapter in self.adapters]
+        decoders = [decode for decode, _ in compiled]
+        encoders = [encode for _, encode in reversed(compiled)]
+
+        if len(compiled) == 1:
+            return compiled[0]
+
+        if len(compiled) == 2:
+            decode_a, decode_b = decoders
+            encode_a, encode_b = encoders
+
+            def decode(value):
+                return decode_b(decode_a(value))
+
+            def encode(value):
+                return encode_b(encode_a(value))
+
+            return decode, encode
+
+        def decode(value):
+            for function in decoders:
+                value = function(value)
+            return value
+
+        def encode(value):
+            for function in encoders:
+                value = function(value)
+            return value
+
+        return decode, encode
@@ -0,0 +1,88 @@
+class MuxChannel(object):
+    """One downstream channel of an i2c multiplexer.
+
+    Behaves like an SMBus instance and can be passed to Device as i2c_dev.
+    Every bus call first makes sure this channel is selected on the multiplexer.
+
+    """
+    def __init__(self, mux, channel):
+        self.mux = mux
+        self.channel = channel
+
+    def __getattr__(self, name):
+        method = getattr(self.mux._i2c, name)
+        if not callable(method):
+            return method
+
+        def call(*args, **kwargs):
+            self.mux.select(self.channel)
+            return method(*args, **kwargs)
+
+        # Cache the wrapper so later calls skip __getattr__
+        self.__dict__[name] = call
+        return call
+
+
+class MuxBus(object):
+    """TCA9548A-style i2c multiplexer.
+
+    Remembers the selected channel so the channel select register is only written when it changes.
+
+    :param i2c_dev: SMBus instance the multiplexer is attached to
+    :param i2c_address: Address of the multiplexer
+    :param channels: Number of downstream channels
+
+    """
+    def __init__(self, i2c_dev=None, i2c_address=0x70, channels=8):
+        self._i2c_address = i2c_address
+        self._channels = [MuxChannel(self, channel) for channel in range(channels)]
+        self._selected = None
+
+        self._i2c = i2c_dev
+
+        if self._i2c is None:
+            import smbus2
+            self._i2c = smbus2.SMBus(1)
+
+    def channel(self, channel):
+        """Get a bus object for one channel, to pass to Device as i2c_dev.
+
+        :param channel: Channel number, from 0
+
+        """
+        return self._channels[channel]
+
+    def select(self, channel):
+        """Select a channel, if it is not already selected.
+
+        :param channel: Channel number, from 0, or None to disconnect all channels
+
+        """
+        if channel != self._selected:
+            self._i2c.write_byte(self._i2c_address, 0 if channel is None else 1 << channel)
+            self._selected = channel
+
+    def invalidate(self):
+        """Forget the selected channel, eg: after the multiplexer is reset, so the next access re-selects."""
+        self._selected = None
+
+    def get_many(self, requests):
+        """Get several registers from devices behind this multiplexer.
+
+        Requests are carried out grouped by channel, starting with the selected channel,
+        so each channel is selected at most once. Results are returned in request order.
+
+        :param requests: List of (device, register name) pairs
+
+        """
+        def channel_order(index):
+            channel = getattr(requests[index][0]._i2c, 'channel', None)
+            if channel is None or channel == self._selected:
+                return (0, 0)
+            return (1, channel)
+
+        results = [None] * len(requests)
+        for index in sorted(range(len(requests)), key=channel_order):
+            device, register = requests[index]
+            results[index] = device.get(register)
+        return results
@@ -0,0 +1,248 @@
+"""Load register maps from JSON or TOML data files.
+
+A register map file contains a list of registers, each with a list of fields:
+
+    {"registers": [
+        {"name": "ALS_CONTROL", "address": "0x80", "fields": [
+            {"name": "gain", "mask": "0b00011100", "adapter": {"type": "lookup", "table": [[1, 0], [2, 1], [4, 2]]}},
+            {"name": "sw_reset", "bit": 1},
+            {"name": "mode", "bit": 0}
+        ]}
+    ]}
+
+A register may override how the device addresses it with, eg:
+"addressing": {"auto_increment": "0x80", "endianness": "little", "block": true}
+
+Numbers may be given as integers or as strings with a 0x/0b/0o prefix.
+
+The validated map is pickled into a __pycache__ directory alongside the source file,
+and reused on subsequent loads for as long as the source file is unchanged.
+"""
+import json
+import os
+import pickle
+
+from . import Addressing, Bank, BitField, BitFlag, Register, __version__
+from .adapter import ChainAdapter, FixedPointAdapter, LittleEndianAdapter, LookupAdapter, ScaleAdapter, TwosComplementAdapter, U16ByteSwapAdapter
+
+REGISTER_KEYS = ('name', 'address', 'fields', 'bit_width', 'read_only', 'volatile', 'bank', 'addressing')
+FIELD_KEYS = ('name', 'mask', 'bit', 'adapter', 'bit_width', 'read_only')
+
+# Cached maps are pickled Register and BitField objects, which unpickle without running __init__.
+# Bump this whenever their attributes change so caches written by older versions are ignored.
+CACHE_FORMAT = 1
+
+
+def load_registers(path, cache=True):
+    """Load a register map from a JSON or TOML file.
+
+    Returns a tuple of Register objects suitable for Device(registers=...).
+
+    :param path: Path to a .json or .toml register map
+    :param cache: Set to False to always parse the source file and skip the on-disk cache
+
+    """
+    path = os.fspath(path)
+    stat = os.stat(path)
+    key = (CACHE_FORMAT, __version__, stat.st_mtime_ns, stat.st_size)
+    cache_path = _cache_path(path)
+
+    if cache:
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, registers = pickle.load(f)
+            if cached_key == key:
+                return registers
+        except Exception:
+            pass
+
+    registers = parse_registers(_load_data(path), path)
+
+    if cache:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+            with open(temp_path, 'wb') as f:
+                pickle.dump((key, registers), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
+
+    return registers
+
+
+def parse_registers(data, source="register map"):
+    """Validate and build registers from a register map already loaded into Python objects.
+
+    :param data: Dictionary with a "registers" list, as loaded from a register map file
+    :param source: Name of the map used in error messages
+
+    """
+    try:
+        register_list = data['registers']
+    except (KeyError, TypeError):
+        raise ValueError("{}: missing registers list".format(source))
+
+    registers = []
+    names = set()
+    for spec in register_list:
+        register = _parse_register(spec, source)
+        if register.name in names:
+            raise ValueError("{}: {}: duplicate register".format(source, register.name))
+        names.add(register.name)
+        registers.append(register)
+
+    for register in registers:
+        if register.bank is not None and register.bank.register not in names:
+            raise ValueError("{}: {}: unknown bank register {}".format(source, register.name, register.bank.register))
+
+    return tuple(registers)
+
+
+def _cache_path(path):
+    directory, filename = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, '__pycache__', filename + '.i2cdevice.pickle')
+
+
+def _load_data(path):
+    if path.endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError:
+            import tomli as tomllib
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _int(value, name, source):
+    if isinstance(value, bool):
+        raise ValueError("{}: {}: expected an integer, got {!r}".format(source, name, value))
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value, 0)
+    except (TypeError, ValueError):
+        raise ValueError("{}: {}: expected an integer, got {!r}".format(source, name, value))
+
+
+def _check_keys(spec, allowed, name, source):
+    unknown = set(spec) - set(allowed)
+    if unknown:
+        raise ValueError("{}: {}: unknown keys {}".format(source, name, ", ".join(sorted(unknown))))
+
+
+def _parse_register(spec, source):
+    if not isinstance(spec, dict):
+        raise ValueError("{}: expected a register table, got {!r}".format(source, spec))
+    name = spec.get('name')
+    if not name:
+        raise ValueError("{}: register missing name".format(source))
+    _check_keys(spec, REGISTER_KEYS, name, source)
+
+    address = _int(spec.get('address'), name, source)
+    bit_width = _int(spec.get('bit_width', 8), name, source)
+    bank = spec.get('bank')
+    if bank is not None:
+        if not isinstance(bank, dict):
+            raise ValueError("{}: {}: bank must be a table of options".format(source, name))
+        _check_keys(bank, ('register', 'value', 'field'), name, source)
+        if 'register' not in bank or 'value' not in bank:
+            raise ValueError("{}: {}: bank needs a register and value".format(source, name))
+        bank = Bank(bank['register'], _int(bank['value'], name, source), bank.get('field'))
+    addressing = spec.get('addressing')
+    if addressing is not None:
+        addressing = _parse_addressing(addressing, name, source)
+
+    fields = []
+    used = 0
+    for field_spec in spec.get('fields', ()):
+        if not isinstance(field_spec, dict):
+            raise ValueError("{}: {}: expected a field table, got {!r}".format(source, name, field_spec))
+        field = _parse_field(field_spec, "{}.{}".format(name, field_spec.get('name')), source)
+        if field.mask >> bit_width:
+            raise ValueError("{}: {}.{}: mask does not fit in {} bits".format(source, name, field.name, bit_width))
+        if field.mask & used:
+            raise ValueError("{}: {}.{}: mask overlaps another field".format(source, name, field.name))
+        used |= field.mask
+        fields.append(field)
+
+    return Register(name, address, fields=fields, bit_width=bit_width,
+                    read_only=bool(spec.get('read_only', False)),
+                    volatile=bool(spec.get('volatile', True)),
+                    bank=bank,
+                    addressing=addressing)
+
+
+def _parse_addressing(spec, name, source):
+    if not isinstance(spec, dict):
+        raise ValueError("{}: {}: addressing must be a table of options".format(source, name))
+    _check_keys(spec, ('auto_increment', 'endianness', 'block'), name, source)
+    endianness = spec.get('endianness', 'big')
+    if endianness not in ('big', 'little'):
+        raise ValueError("{}: {}: endianness must be 'big' or 'little', got {!r}".format(source, name, endianness))
+    return Addressing(auto_increment=_int(spec.get('auto_increment', 0), name, source),
+                      endianness=endianness,
+                      block=bool(spec.get('block', True)))
+
+
+def _parse_field(spec, name, source):
+    _check_keys(spec, FIELD_KEYS, name, source)
+    if not spec.get('name'):
+        raise ValueError("{}: {}: field missing name".format(source, name))
+    read_only = bool(spec.get('read_only', False))
+
+    if 'bit' in spec:
+        if 'mask' in spec or 'adapter' in spec:
+            raise ValueError("{}: {}: bit flags cannot have a mask or adapter".format(source, name))
+        return BitFlag(spec['name'], _int(spec['bit'], name, source), read_only=read_only)
+
+    if 'mask' not in spec:
+        raise ValueError("{}: {}: field missing mask".format(source, name))
+    mask = _int(spec['mask'], name, source)
+    if not mask:
+        raise ValueError("{}: {}: mask is empty".format(source, name))
+
+    adapter = spec.get('adapter')
+    if adapter is not None:
+        adapter = _parse_adapter(adapter, name, source)
+
+    return BitField(spec['name'], mask, adapter=adapter, bit_width=_int(spec.get('bit_width', 8), name, source), read_only=read_only)
+
+
+def _parse_adapter(spec, name, source):
+    if isinstance(spec, str):
+        spec = {'type': spec}
+    spec = dict(spec)
+    adapter_type = spec.pop('type', None)
+
+    try:
+        if adapter_type == 'lookup':
+            table = spec.pop('table')
+            # JSON/TOML keys are always strings, so a list of [key, value] pairs allows numeric keys
+            if not isinstance(table, dict):
+                table = dict((key, _int(value, name, source)) for key, value in table)
+            else:
+                table = dict((key, _int(value, name, source)) for key, value in table.items())
+            adapter = LookupAdapter(table, **spec)
+        elif adapter_type == 'u16_byteswap':
+            adapter = U16ByteSwapAdapter(**spec)
+        elif adapter_type == 'little_endian':
+            adapter = LittleEndianAdapter(**spec)
+        elif adapter_type == 'twos_complement':
+            adapter = TwosComplementAdapter(**spec)
+        elif adapter_type == 'scale':
+            adapter = ScaleAdapter(**spec)
+        elif adapter_type == 'fixed_point':
+            adapter = FixedPointAdapter(**spec)
+        elif adapter_type == 'chain':
+            adapter = ChainAdapter(*[_parse_adapter(child, name, source) for child in spec.pop('adapters')])
+            if spec:
+                raise TypeError("unexpected arguments {}".format(", ".join(sorted(spec))))
+        else:
+            raise ValueError("{}: {}: unknown adapter type {!r}".format(source, name, adapter_type))
+    except (KeyError, TypeError) as error:
+        raise ValueError("{}: {}: invalid {} adapter: {}".format(source, name, adapter_type, error))
+
+    return adapter
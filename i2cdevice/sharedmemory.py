@@ -0,0 +1,276 @@
+"""Publish register samples to other processes through shared memory.
+
+A SamplePublisher reads registers from a Device and writes each sample as a fixed size
+record into a ring buffer in a multiprocessing.shared_memory block. SampleReader attaches
+to the same block by name from any process, without needing the register definitions.
+
+Each record starts with a sequence stamp: odd while the record is being written and
+2 * (index + 1) once sample index is complete. Readers check the stamp before and after
+copying a record, so torn or overwritten records are detected without any locking.
+"""
+import json
+import numbers
+import struct
+import time
+
+from .adapter import ChainAdapter, LookupAdapter
+
+MAGIC = b'I2CD'
+LAYOUT_VERSION = 1
+
+# magic, layout version, header size, record size, capacity, samples published
+HEADER = struct.Struct('<4sHHIIQ')
+COUNT_OFFSET = 16
+STAMP = struct.Struct('<Q')
+
+MODES = ('fields', 'raw', 'decoded')
+
+NUMPY_TYPES = {'d': '<f8', 'B': 'u1', 'H': '<u2', 'I': '<u4', 'Q': '<u8'}
+
+# Blocks created by publishers in this process, which the resource tracker must keep tracking
+_published = set()
+
+
+def _int_format(bits):
+    for size, code in ((8, 'B'), (16, 'H'), (32, 'I'), (64, 'Q')):
+        if bits <= size:
+            return code
+    raise ValueError("{} bit values cannot be published".format(bits))
+
+
+def _numeric_adapter(adapter):
+    # Lookup tables are the only built-in adapters which can decode to something other than a number
+    if isinstance(adapter, ChainAdapter):
+        return not adapter.adapters or _numeric_adapter(adapter.adapters[-1])
+    if isinstance(adapter, LookupAdapter):
+        return all(isinstance(key, numbers.Real) for key in adapter.lookup_table)
+    return True
+
+
+def _align(value, alignment=8):
+    return (value + alignment - 1) // alignment * alignment
+
+
+def _attach(name):
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the block with the resource tracker, which would unlink it when this process exits
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name=name)
+        if shm.name not in _published:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class SamplePublisher(object):
+    """Publish register samples into a shared memory ring buffer.
+
+    The record layout is derived from the registers' field definitions:
+
+    * fields - one unsigned integer per field, sized to fit its mask (default)
+    * raw - one unsigned integer per register, sized to fit its bit width
+    * decoded - one float per field, passed through the field's adapter, which must return a number
+
+    Every record also starts with a float "timestamp" from time.time().
+
+    :param device: Device to read registers from
+    :param registers: Names of registers to publish
+    :param name: Name of the shared memory block, generated if not given
+    :param capacity: Number of records in the ring buffer, at least 2 so the latest complete record is never the one being written
+    :param mode: Record layout, one of "fields", "raw" or "decoded"
+
+    """
+    def __init__(self, device, registers, name=None, capacity=1024, mode='fields'):
+        from multiprocessing import shared_memory
+
+        if mode not in MODES:
+            raise ValueError("mode must be one of {}".format(", ".join(MODES)))
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+
+        self.device = device
+        self.registers = list(registers)
+        self.capacity = capacity
+        self.mode = mode
+
+        names = ['timestamp']
+        formats = ['d']
+        self._columns = []
+        for register_name in self.registers:
+            register = device.registers[register_name]
+            if mode == 'raw':
+                names.append(register.name)
+                formats.append(_int_format(register.bit_width))
+                continue
+            for field in sorted(register.fields.values(), key=lambda field: field.mask):
+                if mode == 'decoded' and not _numeric_adapter(field.adapter):
+                    raise ValueError("{}.{}: adapter does not decode to a number".format(register.name, field.name))
+                names.append("{}.{}".format(register.name, field.name))
+                formats.append('d' if mode == 'decoded' else _int_format(field.mask.bit_length() - field.shift))
+                self._columns.append((register, field))
+
+        self.names = tuple(names)
+        self.format = '<' + ''.join(formats)
+        self._payload = struct.Struct(self.format)
+
+        layout = json.dumps({'format': self.format, 'names': self.names}).encode('utf-8')
+        self.header_size = _align(HEADER.size + 2 + len(layout))
+        self.record_size = _align(STAMP.size + self._payload.size)
+
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=self.header_size + self.record_size * capacity)
+        self.name = self.shm.name
+        _published.add(self.name)
+
+        buf = self.shm.buf
+        HEADER.pack_into(buf, 0, MAGIC, LAYOUT_VERSION, self.header_size, self.record_size, capacity, 0)
+        struct.pack_into('<H', buf, HEADER.size, len(layout))
+        buf[HEADER.size + 2:HEADER.size + 2 + len(layout)] = layout
+
+        self._count = 0
+
+    def publish(self):
+        """Read the registers and publish them as the next sample.
+
+        Registers are read with Device.read_registers, coalescing them into as few transfers as possible.
+
+        Returns the index of the published sample.
+
+        """
+        raw = self.device.read_registers(self.registers)
+        values = [time.time()]
+        if self.mode == 'raw':
+            values.extend(raw[name] for name in self.registers)
+        elif self.mode == 'decoded':
+            values.extend(self.device._decode_field(register, field, raw[register.name]) for register, field in self._columns)
+        else:
+            values.extend((raw[register.name] & field.mask) >> field.shift for register, field in self._columns)
+        return self.write(values)
+
+    def write(self, values):
+        """Publish a sample of already read values, in the order of names.
+
+        :param values: Sequence of values, starting with the timestamp
+
+        Returns the index of the published sample.
+
+        """
+        # Pack first, so values which don't fit the format leave the ring buffer untouched
+        try:
+            payload = self._payload.pack(*values)
+        except struct.error as error:
+            raise ValueError("values do not match format {}: {}".format(self.format, error))
+
+        index = self._count
+        offset = self.header_size + (index % self.capacity) * self.record_size
+        buf = self.shm.buf
+        STAMP.pack_into(buf, offset, 2 * index + 1)
+        buf[offset + STAMP.size:offset + STAMP.size + len(payload)] = payload
+        STAMP.pack_into(buf, offset, 2 * index + 2)
+        STAMP.pack_into(buf, COUNT_OFFSET, index + 1)
+        self._count = index + 1
+        return index
+
+    def close(self):
+        self.shm.close()
+
+    def unlink(self):
+        """Close and remove the shared memory block, once no longer needed by any reader."""
+        self.shm.close()
+        self.shm.unlink()
+        _published.discard(self.name)
+
+
+class SampleReader(object):
+    """Read samples from a SamplePublisher, in this or another process.
+
+    :param name: Name of the shared memory block, from SamplePublisher.name
+
+    """
+    def __init__(self, name):
+        self.shm = _attach(name)
+        buf = self.shm.buf
+        magic, version, self.header_size, self.record_size, self.capacity, _ = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self.shm.close()
+            raise ValueError("{}: not an i2cdevice sample buffer".format(name))
+        length, = struct.unpack_from('<H', buf, HEADER.size)
+        layout = json.loads(bytes(buf[HEADER.size + 2:HEADER.size + 2 + length]).decode('utf-8'))
+
+        self.name = name
+        self.format = layout['format']
+        self.names = tuple(layout['names'])
+        self._payload = struct.Struct(self.format)
+
+    @property
+    def count(self):
+        """Number of samples published so far."""
+        return STAMP.unpack_from(self.shm.buf, COUNT_OFFSET)[0]
+
+    def read(self, index):
+        """Read a sample by index.
+
+        Returns a tuple of values in the order of names, or None if the sample
+        has not been published yet or has been overwritten.
+
+        :param index: Index of the sample, from 0
+
+        """
+        offset = self.header_size + (index % self.capacity) * self.record_size
+        expected = 2 * index + 2
+        buf = self.shm.buf
+        if STAMP.unpack_from(buf, offset)[0] != expected:
+            return None
+        values = self._payload.unpack_from(buf, offset + STAMP.size)
+        # If the stamp changed while copying, a newer sample was being written over this one
+        if STAMP.unpack_from(buf, offset)[0] != expected:
+            return None
+        return values
+
+    def latest(self):
+        """Read the most recent sample.
+
+        Returns an (index, values) tuple, or None if nothing has been published.
+
+        """
+        while True:
+            count = self.count
+            if count == 0:
+                return None
+            values = self.read(count - 1)
+            if values is not None:
+                return count - 1, values
+
+    def records(self):
+        """Get a zero-copy memoryview of the ring buffer's records.
+
+        Each record is record_size bytes: a little-endian unsigned 64bit sequence stamp followed by the values packed using format.
+        Release the view before calling close.
+
+        """
+        return self.shm.buf[self.header_size:self.header_size + self.record_size * self.capacity]
+
+    def as_array(self):
+        """Get a zero-copy NumPy structured array of the ring buffer's records.
+
+        Requires NumPy. The "sequence" column holds each record's stamp, see the module documentation.
+
+        """
+        import numpy
+
+        names = ['sequence']
+        formats = [NUMPY_TYPES['Q']]
+        offsets = [0]
+        offset = STAMP.size
+        for name, code in zip(self.names, self.format[1:]):
+            names.append(name)
+            formats.append(NUMPY_TYPES[code])
+            offsets.append(offset)
+            offset += struct.calcsize('<' + code)
+
+        dtype = numpy.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': self.record_size})
+        return numpy.ndarray(shape=(self.capacity,), dtype=dtype, buffer=self.shm.buf, offset=self.header_size)
+
+    def close(self):
+        self.shm.close()
@@ -0,0 +1,24 @@
+import pytest
+
+from i2cdevice import MockSMBus
+
+
+class RecordingSMBus(MockSMBus):
+    """MockSMBus which records the block reads and writes made through it."""
+    def __init__(self, *args, **kwargs):
+        MockSMBus.__init__(self, *args, **kwargs)
+        self.reads = []
+        self.writes = []
+
+    def read_i2c_block_data(self, i2c_address, register, length):
+        self.reads.append((register, length))
+        return MockSMBus.read_i2c_block_data(self, i2c_address, register, length)
+
+    def write_i2c_block_data(self, i2c_address, register, values):
+        self.writes.append((register, list(values)))
+        MockSMBus.write_i2c_block_data(self, i2c_address, register, values)
+
+
+@pytest.fixture()
+def bus():
+    return RecordingSMBus(1)
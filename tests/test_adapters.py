@@ -1,6 +1,6 @@
 import pytest
 
-from i2cdevice.adapter import Adapter, LookupAdapter, U16ByteSwapAdapter
+from i2cdevice.adapter import Adapter, ChainAdapter, FixedPointAdapter, LittleEndianAdapter, LookupAdapter, ScaleAdapter, TwosComplementAdapter, U16ByteSwapAdapter
 
 
 def test_adaptor_class():
@@ -37,3 +37,101 @@ def test_byteswap_adapter():
     adapter = U16ByteSwapAdapter()
     assert adapter._encode(0xFF00) == 0x00FF
     assert adapter._decode(0x00FF) == 0xFF00
+
+
+def test_compiled_matches_adapter():
+    adapters = (
+        (LookupAdapter({'Zero': 0, 'One': 1}), ['Zero', 'One']),
+        (U16ByteSwapAdapter(), [0x0000, 0x1234, 0xFF00]),
+        (LittleEndianAdapter(3), [0x000000, 0x123456, 0xFFFF00]),
+        (TwosComplementAdapter(12), [-2048, -1, 0, 1, 2047]),
+        (ScaleAdapter(0.5, -40), [-40, 0, 87.5]),
+        (FixedPointAdapter(4, bit_width=12, signed=True), [-128, -0.0625, 0, 0.5, 127.9375]),
+        (FixedPointAdapter(8), [0, 0.5, 255.99609375]),
+    )
+    for adapter, values in adapters:
+        decode, encode = adapter._compile()
+        for value in values:
+            raw = adapter._encode(value)
+            assert encode(value) == raw
+            assert decode(raw) == adapter._decode(raw) == value
+
+
+def test_compiled_lookup_error():
+    decode, _ = LookupAdapter({'Zero': 0})._compile()
+    with pytest.raises(ValueError):
+        decode(2)
+
+
+def test_twos_complement_adapter():
+    adapter = TwosComplementAdapter(8)
+    assert adapter._decode(0xFF) == -1
+    assert adapter._decode(0x7F) == 127
+    assert adapter._encode(-128) == 0x80
+
+
+def test_chain_adapter():
+    # Signed little-endian 16bit value in 1/100ths of a unit
+    adapter = ChainAdapter(LittleEndianAdapter(2), TwosComplementAdapter(16), ScaleAdapter(0.01))
+    assert adapter._decode(0x18FC) == -10.0
+    assert adapter._encode(-10.0) == 0x18FC
+
+    decode, encode = adapter._compile()
+    assert decode(0x18FC) == -10.0
+    assert encode(-10.0) == 0x18FC
+
+
+def test_chain_adapter_compiled_matches():
+    # Rounding and masking in each stage must be kept when compiled
+    chains = (
+        ChainAdapter(ScaleAdapter(0.5), FixedPointAdapter(4)),
+        ChainAdapter(FixedPointAdapter(4, bit_width=8)),
+        ChainAdapter(FixedPointAdapter(2), ScaleAdapter(10, 5), ScaleAdapter(2)),
+        ChainAdapter(LittleEndianAdapter(2), TwosComplementAdapter(16), ScaleAdapter(0.01, -5)),
+    )
+    for adapter in chains:
+        _, encode = adapter._compile()
+        for value in (0, 1.0 / 32, 0.1, 1.5, 40.0, 100, 255):
+            assert encode(value) == adapter._encode(value)
+
+    for adapter in chains[1:]:
+        decode, _ = adapter._compile()
+        for raw in (0, 1, 6, 0x7F, 0xFF, 0x18FC):
+            assert decode(raw) == adapter._decode(raw)
+
+    assert chains[0]._compile()[1](1.0 / 32) == 0
+    assert chains[1]._compile()[1](100) == 64
+
+
+def test_compile_respects_overrides():
+    class CustomLookupAdapter(LookupAdapter):
+        def _decode(self, value):
+            return 'custom'
+
+    class CustomByteSwapAdapter(U16ByteSwapAdapter):
+        def _byteswap(self, value):
+            return value
+
+    decode, _ = CustomLookupAdapter({'a': 0})._compile()
+    assert decode(0) == 'custom'
+
+    decode, encode = CustomByteSwapAdapter()._compile()
+    assert decode(0x1234) == encode(0x1234) == 0x1234
+
+    decode, _ = ChainAdapter(CustomLookupAdapter({'a': 0}))._compile()
+    assert decode(0) == 'custom'
+
+
+def test_compiled_lookup_sees_table_changes():
+    adapter = LookupAdapter({'a': 0}, snap=False)
+    decode, encode = adapter._compile()
+    assert decode(0) == 'a'
+
+    adapter.lookup_table['b'] = 1
+    assert encode('b') == 1
+    assert decode(1) == 'b'
+
+    adapter.lookup_table['a'] = 2
+    adapter.lookup_table['c'] = 0
+    assert decode(0) == 'c'
+    assert decode(2) == 'a'
@@ -0,0 +1,103 @@
+import pytest
+
+from i2cdevice import Addressing, BitField, Device, MockSMBus, Register
+
+
+class LoggingSMBus(MockSMBus):
+    """Mock bus which strips a 0x80 auto-increment flag and logs transfers."""
+    def __init__(self, *args, **kwargs):
+        MockSMBus.__init__(self, *args, **kwargs)
+        self.log = []
+
+    def read_i2c_block_data(self, i2c_address, register, length):
+        self.log.append(('read_block', register, length))
+        return MockSMBus.read_i2c_block_data(self, i2c_address, register & 0x7F, length)
+
+    def write_i2c_block_data(self, i2c_address, register, values):
+        self.log.append(('write_block', register, len(values)))
+        MockSMBus.write_i2c_block_data(self, i2c_address, register & 0x7F, values)
+
+    def read_byte_data(self, i2c_address, register):
+        self.log.append(('read_byte', register))
+        return MockSMBus.read_byte_data(self, i2c_address, register)
+
+    def write_byte_data(self, i2c_address, register, value):
+        self.log.append(('write_byte', register))
+        MockSMBus.write_byte_data(self, i2c_address, register, value)
+
+
+def test_auto_increment_little_endian():
+    bus = LoggingSMBus(1)
+    bus.regs[0x28:0x2C] = [0x34, 0x12, 0x78, 0x56]
+    device = Device(0x1D, i2c_dev=bus, addressing=Addressing(auto_increment=0x80, endianness='little'), registers=(
+        Register('CTRL', 0x20, fields=(BitField('odr', 0xF0),)),
+        Register('OUT_X', 0x28, fields=(BitField('x', 0xFFFF),), bit_width=16),
+        Register('OUT_Y', 0x2A, fields=(BitField('y', 0xFFFF),), bit_width=16),
+    ))
+
+    assert device.get('OUT_X').x == 0x1234
+    assert bus.log[-1] == ('read_block', 0xA8, 2)
+
+    # Single byte registers don't need the flag
+    device.get('CTRL')
+    assert bus.log[-1] == ('read_block', 0x20, 1)
+
+    assert device.read_registers(['OUT_X', 'OUT_Y']) == {'OUT_X': 0x1234, 'OUT_Y': 0x5678}
+    assert bus.log[-1] == ('read_block', 0xA8, 4)
+
+    device.set('OUT_Y', y=0xABCD)
+    assert bus.log[-1] == ('write_block', 0xAA, 2)
+    assert bus.regs[0x2A:0x2C] == [0xCD, 0xAB]
+
+
+def test_register_addressing_override():
+    bus = LoggingSMBus(1)
+    bus.regs[0x00:0x04] = [0x12, 0x34, 0x56, 0x78]
+    device = Device(0x1D, i2c_dev=bus, registers=(
+        Register('BIG', 0x00, fields=(BitField('value', 0xFFFF),), bit_width=16),
+        Register('LITTLE', 0x02, fields=(BitField('value', 0xFFFF),), bit_width=16, addressing=Addressing(endianness='little')),
+    ))
+
+    assert device.get('BIG').value == 0x1234
+    assert device.get('LITTLE').value == 0x7856
+
+    # Different policies are never coalesced into one transfer
+    del bus.log[:]
+    device.read_registers(['BIG', 'LITTLE'])
+    assert len(bus.log) == 2
+
+
+def test_equal_addressing_coalesced():
+    bus = LoggingSMBus(1)
+    device = Device(0x1D, i2c_dev=bus, registers=(
+        Register('X', 0x28, fields=(BitField('x', 0xFFFF),), bit_width=16, addressing=Addressing(auto_increment=0x80)),
+        Register('Y', 0x2A, fields=(BitField('y', 0xFFFF),), bit_width=16, addressing=Addressing(auto_increment=0x80)),
+    ))
+
+    assert Addressing(auto_increment=0x80) == Addressing(auto_increment=0x80)
+    assert Addressing(auto_increment=0x80) != Addressing(auto_increment=0x80, block=False)
+
+    # Separate but equal policies share one transfer
+    device.read_registers(['X', 'Y'])
+    assert bus.log == [('read_block', 0xA8, 4)]
+
+
+def test_no_block_transfers():
+    bus = LoggingSMBus(1)
+    bus.regs[0x10:0x13] = [0x01, 0x02, 0x03]
+    device = Device(0x1D, i2c_dev=bus, addressing=Addressing(block=False), registers=(
+        Register('A', 0x10, fields=(BitField('a', 0xFFFF),), bit_width=16),
+        Register('B', 0x12, fields=(BitField('b', 0xFF),)),
+    ))
+
+    assert device.read_registers(['A', 'B']) == {'A': 0x0102, 'B': 0x03}
+    assert bus.log == [('read_byte', 0x10), ('read_byte', 0x11), ('read_byte', 0x12)]
+
+    device.set('A', a=0xBEEF)
+    assert bus.log[-2:] == [('write_byte', 0x10), ('write_byte', 0x11)]
+    assert bus.regs[0x10:0x12] == [0xBE, 0xEF]
+
+
+def test_invalid_endianness():
+    with pytest.raises(ValueError):
+        Addressing(endianness='middle')
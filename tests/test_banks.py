@@ -0,0 +1,88 @@
+import pytest
+
+from i2cdevice import Addressing, Bank, BitField, Device, MockSMBus, Register
+
+
+def test_bank_select_cached(bus):
+    device = Device(0x00, i2c_dev=bus, registers=(
+        Register('BANK', 0x7F, fields=(
+            BitField('bank', 0xFF),
+        )),
+        Register('A', 0x10, fields=(
+            BitField('a', 0xFF),
+        ), bank=Bank('BANK', 1)),
+        Register('B', 0x11, fields=(
+            BitField('b', 0xFF),
+        ), bank=Bank('BANK', 1)),
+        Register('C', 0x10, fields=(
+            BitField('c', 0xFF),
+        ), bank=Bank('BANK', 2)),
+    ))
+
+    device.get('A')
+    device.get('B')
+    device.set('A', a=5)
+    assert bus.writes == [(0x7F, [1]), (0x10, [5])]
+
+    device.get('C')
+    assert bus.writes[-1] == (0x7F, [2])
+    assert bus.regs[0x7F] == 2
+
+    device.invalidate_banks()
+    device.get('C')
+    assert bus.writes[-1] == (0x7F, [2])
+    assert len(bus.writes) == 4
+
+
+def test_bank_select_field(bus):
+    bus.regs[0x7F] = 0b00000001
+    device = Device(0x00, i2c_dev=bus, registers=(
+        Register('BANK', 0x7F, fields=(
+            BitField('user_bank', 0b00110000),
+            BitField('other', 0b00000001),
+        )),
+        Register('A', 0x10, fields=(
+            BitField('a', 0xFF),
+        ), bank=Bank('BANK', 2, field='user_bank')),
+    ))
+
+    device.get('A')
+    device.get('A')
+    assert bus.writes == [(0x7F, [0b00100001])]
+
+    # Writing the select register directly updates the cached bank
+    device.set('BANK', user_bank=0)
+    device.get('A')
+    assert bus.writes[-1] == (0x7F, [0b00100001])
+
+
+def test_bank_select_missing():
+    with pytest.raises(ValueError):
+        Device(0x00, i2c_dev=MockSMBus(1), registers=(
+            Register('A', 0x10, fields=(BitField('a', 0xFF),), bank=Bank('BANK', 1)),
+        ))
+
+    with pytest.raises(ValueError):
+        Device(0x00, i2c_dev=MockSMBus(1), registers=(
+            Register('BANK', 0x7F, fields=(BitField('bank', 0xFF),)),
+            Register('A', 0x10, fields=(BitField('a', 0xFF),), bank=Bank('BANK', 1, field='page')),
+        ))
+
+    # A banked select register would need its own bank selected first, forever
+    with pytest.raises(ValueError):
+        Device(0x00, i2c_dev=MockSMBus(1), registers=(
+            Register('BANK', 0x7F, fields=(BitField('bank', 0xFF),), bank=Bank('BANK', 0)),
+            Register('A', 0x10, fields=(BitField('a', 0xFF),), bank=Bank('BANK', 1)),
+        ))
+
+
+def test_bank_switched_once_across_addressing(bus):
+    device = Device(0x00, i2c_dev=bus, registers=(
+        Register('BANK', 0x7F, fields=(BitField('bank', 0xFF),)),
+        Register('A', 0x10, fields=(BitField('a', 0xFF),), bank=Bank('BANK', 0)),
+        Register('B', 0x10, fields=(BitField('b', 0xFF),), bank=Bank('BANK', 1)),
+        Register('C', 0x20, fields=(BitField('c', 0xFFFF),), bit_width=16, bank=Bank('BANK', 0), addressing=Addressing(endianness='little')),
+    ))
+
+    device.read_registers(['A', 'B', 'C'])
+    assert [register for register, _ in bus.writes] == [0x7F, 0x7F]
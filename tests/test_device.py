@@ -1,7 +1,7 @@
 import pytest
 
 from i2cdevice import BitField, BitFlag, Device, MockSMBus, Register
-from i2cdevice.adapter import U16ByteSwapAdapter
+from i2cdevice.adapter import ChainAdapter, LookupAdapter, ScaleAdapter, TwosComplementAdapter, U16ByteSwapAdapter
 
 
 def test_register_locking():
@@ -133,3 +133,38 @@ def test_missing_regiser():
 
     with pytest.raises(KeyError):
         device.get_register('foo')
+
+
+def test_builtin_adapters():
+    bus = MockSMBus(1)
+    device = Device(0x00, i2c_dev=bus, registers=(
+        Register('temperature', 0x00, fields=(
+            BitField('temperature', 0xFFF0, adapter=ChainAdapter(TwosComplementAdapter(12), ScaleAdapter(0.0625))),
+        ), bit_width=16),
+    ))
+
+    device.set('temperature', temperature=-25.0)
+    assert bus.regs[0:2] == [0xE7, 0x00]
+    assert device.get('temperature').temperature == -25.0
+
+
+def test_custom_lookup_adapter():
+    class CustomLookupAdapter(LookupAdapter):
+        def _decode(self, value):
+            return 'custom'
+
+    adapter = LookupAdapter({'a': 0})
+    device = Device(0x00, i2c_dev=MockSMBus(1), registers=(
+        Register('custom', 0x00, fields=(
+            BitField('f', 0x0F, adapter=CustomLookupAdapter({'a': 0})),
+        )),
+        Register('lookup', 0x01, fields=(
+            BitField('f', 0x0F, adapter=adapter),
+        )),
+    ))
+
+    assert device.get('custom').f == 'custom'
+
+    adapter.lookup_table['b'] = 1
+    device.set('lookup', f='b')
+    assert device.get('lookup').f == 'b'
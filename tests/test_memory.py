@@ -0,0 +1,142 @@
+import sys
+import types
+
+import pytest
+
+from i2cdevice import Device, MemoryRegion, MockSMBus
+
+
+class FakeMsg(object):
+    def __init__(self, addr, data):
+        self.addr = addr
+        self.data = bytearray(data)
+
+    @classmethod
+    def write(cls, addr, data):
+        return cls(addr, data)
+
+    @classmethod
+    def read(cls, addr, length):
+        return cls(addr, [0] * length)
+
+    def __bytes__(self):
+        return bytes(self.data)
+
+
+class EEPROMBus(object):
+    """Fake 16-bit addressed EEPROM which NACKs while busy."""
+    def __init__(self, size=8192, busy_polls=0):
+        self.memory = bytearray(size)
+        self.transactions = []
+        self.busy_polls = busy_polls
+        self.busy = 0
+
+    def write_i2c_block_data(self, i2c_address, register, values):
+        assert len(values) <= 32
+        address = (register << 8) | values[0]
+        self.transactions.append(('write', address, len(values) - 1))
+        self.memory[address:address + len(values) - 1] = bytes(values[1:])
+        self.busy = self.busy_polls
+
+    def write_quick(self, i2c_address):
+        if self.busy:
+            self.busy -= 1
+            raise IOError(121, "Remote I/O error")
+
+    def i2c_rdwr(self, write, read):
+        address = (write.data[0] << 8) | write.data[1]
+        self.transactions.append(('read', address, len(read.data)))
+        read.data[:] = self.memory[address:address + len(read.data)]
+
+
+@pytest.fixture()
+def smbus2(monkeypatch):
+    module = types.ModuleType('smbus2')
+    module.i2c_msg = FakeMsg
+    monkeypatch.setitem(sys.modules, 'smbus2', module)
+    return module
+
+
+def test_memory_8bit():
+    bus = MockSMBus(1)
+    device = Device(0x50, i2c_dev=bus, regions=(
+        MemoryRegion('eeprom', address=0x10, size=64),
+    ))
+
+    device.eeprom.write(0, b'hello world')
+    assert bytes(bus.regs[0x10:0x1b]) == b'hello world'
+    assert device.eeprom.read(6, 5) == b'world'
+    assert len(device.eeprom.read()) == 64
+
+    with pytest.raises(ValueError):
+        device.eeprom.read(60, 5)
+
+
+def test_memory_16bit_chunked(smbus2):
+    bus = EEPROMBus(busy_polls=2)
+    device = Device(0x50, i2c_dev=bus, regions=(
+        MemoryRegion('eeprom', size=8192, address_width=16, page_size=32, write_timeout=0.1),
+    ))
+
+    data = bytes(range(256)) * 2
+    device.write_memory('eeprom', 20, memoryview(data))
+    assert bus.memory[20:20 + 512] == data
+
+    writes = [t for t in bus.transactions if t[0] == 'write']
+    # Split at page boundaries: 12 bytes to the end of the first page, then 31 byte blocks within each page
+    assert writes[0] == ('write', 20, 12)
+    assert all(address // 32 == (address + length - 1) // 32 for _, address, length in writes)
+    assert sum(length for _, _, length in writes) == 512
+
+    del bus.transactions[:]
+    assert device.read_memory('eeprom', 20, 512) == data
+    assert bus.transactions == [('read', 20, 512)]
+
+
+def test_memory_stream(smbus2):
+    bus = EEPROMBus()
+    bus.memory[:] = bytes(range(256)) * 32
+    device = Device(0x50, i2c_dev=bus, regions=(
+        MemoryRegion('eeprom', size=8192, address_width=16),
+    ))
+
+    chunks = list(device.eeprom.stream(chunk_size=1024))
+    assert len(chunks) == 8
+    assert b''.join(chunks) == bus.memory
+
+    buf = bytearray(100)
+    assert device.read_memory_into('eeprom', 256, memoryview(buf)) == 100
+    assert buf == bus.memory[256:356]
+
+
+def test_memory_write_timeout():
+    bus = EEPROMBus(busy_polls=1000000)
+    device = Device(0x50, i2c_dev=bus, regions=(
+        MemoryRegion('eeprom', size=8192, address_width=16, write_timeout=0.01),
+    ))
+
+    with pytest.raises(TimeoutError):
+        device.write_memory('eeprom', 0, [1, 2, 3])
+
+
+def test_memory_read_only():
+    device = Device(0x50, i2c_dev=MockSMBus(1), regions=(
+        MemoryRegion('rom', size=16, read_only=True),
+    ))
+
+    with pytest.raises(ValueError):
+        device.rom.write(0, b'x')
+
+
+def test_memory_stream_validates_on_call():
+    device = Device(0x50, i2c_dev=MockSMBus(1), regions=(
+        MemoryRegion('eeprom', size=256),
+        MemoryRegion('wide', size=8192, address_width=16),
+    ))
+
+    with pytest.raises(ValueError):
+        device.eeprom.stream(9000)
+
+    # MockSMBus has no i2c_rdwr
+    with pytest.raises(IOError):
+        device.wide.stream()
@@ -0,0 +1,80 @@
+import pytest
+
+from i2cdevice import BitField, Device, MockSMBus, Register
+
+
+class MultiSMBus(MockSMBus):
+    """Mock bus with a separate register file for each address."""
+    def __init__(self, *args, **kwargs):
+        MockSMBus.__init__(self, *args, **kwargs)
+        self.devices = {}
+        self.reads = 0
+
+    def write_i2c_block_data(self, i2c_address, register, values):
+        self.regs = self.devices.setdefault(i2c_address, [0] * 255)
+        MockSMBus.write_i2c_block_data(self, i2c_address, register, values)
+
+    def read_i2c_block_data(self, i2c_address, register, length):
+        self.reads += 1
+        self.regs = self.devices.setdefault(i2c_address, [0] * 255)
+        return MockSMBus.read_i2c_block_data(self, i2c_address, register, length)
+
+
+REGISTERS = (
+    Register('CONFIG', 0x01, fields=(
+        BitField('gain', 0b11111110),
+        BitField('mode', 0b00000001),
+    )),
+    Register('ID', 0x02, fields=(
+        BitField('id', 0xFF),
+    ), volatile=False),
+)
+
+
+@pytest.fixture()
+def bus():
+    return MultiSMBus(1)
+
+
+@pytest.fixture()
+def device(bus):
+    return Device([0x48, 0x49, 0x4A, 0x4B], i2c_dev=bus, registers=REGISTERS)
+
+
+def test_get_all(bus, device):
+    for address in (0x48, 0x49, 0x4A, 0x4B):
+        bus.devices[address] = [0] * 255
+        bus.devices[address][0x01] = address & 0x0F
+
+    result = device.get_all('CONFIG')
+    assert list(result) == [0x48, 0x49, 0x4A, 0x4B]
+    assert [r.gain for r in result.values()] == [4, 4, 5, 5]
+    assert [r.mode for r in result.values()] == [0, 1, 0, 1]
+    assert device._i2c_address == 0x48
+
+
+def test_set_all(bus, device):
+    device.select_address(0x4B)
+
+    device.set_all('CONFIG', gain=3)
+    assert all(regs[0x01] == 0b0110 for regs in bus.devices.values())
+    assert device._i2c_address == 0x4B
+
+    # Every bit is replaced, so nothing is read first
+    reads = bus.reads
+    device.set_all('CONFIG', gain=1, mode=1)
+    assert bus.reads == reads
+    assert set(r.gain for r in device.get_all('CONFIG').values()) == {1}
+
+
+def test_values_per_address(bus, device):
+    bus.devices[0x48] = [0] * 255
+    bus.devices[0x49] = [0] * 255
+    bus.devices[0x48][0x02] = 0x11
+    bus.devices[0x49][0x02] = 0x22
+
+    assert device.get('ID').id == 0x11
+    device.select_address(0x49)
+    assert device.get('ID').id == 0x22
+    device.select_address(0x48)
+    assert device.values['ID'] == 0x11
@@ -0,0 +1,63 @@
+import pytest
+
+from i2cdevice import BitField, Device, MockSMBus, Register
+from i2cdevice.mux import MuxBus
+
+
+class MuxSMBus(MockSMBus):
+    """Mock bus with a multiplexer at 0x70 and a separate register file per channel."""
+    def __init__(self, *args, **kwargs):
+        MockSMBus.__init__(self, *args, **kwargs)
+        self.selects = []
+        self.channels = [[0] * 255 for _ in range(8)]
+
+    def write_byte(self, i2c_address, value):
+        assert i2c_address == 0x70
+        self.selects.append(value)
+        self.regs = self.channels[value.bit_length() - 1]
+
+
+REGISTERS = (
+    Register('DATA', 0x00, fields=(
+        BitField('data', 0xFF),
+    )),
+)
+
+
+@pytest.fixture()
+def bus():
+    return MuxSMBus(1)
+
+
+def test_mux_channel_select_cached(bus):
+    mux = MuxBus(bus)
+    sensor0 = Device(0x40, i2c_dev=mux.channel(0), registers=REGISTERS)
+    sensor3 = Device(0x40, i2c_dev=mux.channel(3), registers=REGISTERS)
+
+    sensor0.set('DATA', data=10)
+    sensor0.get('DATA')
+    sensor3.set('DATA', data=33)
+    sensor3.get('DATA')
+    assert bus.selects == [0b00000001, 0b00001000]
+
+    assert sensor0.get('DATA').data == 10
+    assert sensor3.get('DATA').data == 33
+    assert bus.selects == [0b00000001, 0b00001000, 0b00000001, 0b00001000]
+
+    mux.invalidate()
+    sensor3.get('DATA')
+    assert bus.selects[-1] == 0b00001000
+    assert len(bus.selects) == 5
+
+
+def test_mux_get_many(bus):
+    mux = MuxBus(bus)
+    sensors = [Device(0x40, i2c_dev=mux.channel(channel), registers=REGISTERS) for channel in range(4)]
+    for channel, sensor in enumerate(sensors):
+        sensor.set('DATA', data=channel)
+    del bus.selects[:]
+
+    # Channel 3 is still selected, so it goes first and each channel is selected once
+    results = mux.get_many([(sensor, 'DATA') for sensor in sensors * 2])
+    assert [result.data for result in results] == [0, 1, 2, 3] * 2
+    assert bus.selects == [0b0001, 0b0010, 0b0100]
@@ -0,0 +1,126 @@
+import pytest
+
+from i2cdevice import BitField, Device, Register
+
+REGISTERS = (
+    Register('STATUS', 0x10, fields=(BitField('ready', 0x01),)),
+    Register('DATA_X', 0x11, fields=(BitField('x', 0xFFFF),), bit_width=16),
+    Register('DATA_Y', 0x13, fields=(BitField('y', 0xFFFF),), bit_width=16),
+    Register('CONFIG', 0x20, fields=(BitField('mode', 0xFF),)),
+)
+
+
+@pytest.fixture()
+def device(bus):
+    return Device(0x00, i2c_dev=bus, registers=REGISTERS)
+
+
+def sample(device):
+    device.get('STATUS')
+    device.get_field('DATA_X', 'x')
+    return device.get('DATA_Y').y
+
+
+def test_prefetch_learns_plan(bus, device):
+    device.enable_prefetch(threshold=3)
+
+    for _ in range(3):
+        sample(device)
+    assert len(bus.reads) == 9
+    assert device.get_prefetch_plan() == {}
+
+    # The fourth cycle starts, the pattern is learned and read in one transfer
+    del bus.reads[:]
+    bus.regs[0x13:0x15] = [0x12, 0x34]
+    assert sample(device) == 0x1234
+    assert bus.reads == [(0x10, 5)]
+    assert device.get_prefetch_plan() == {'STATUS': ('STATUS', 'DATA_X', 'DATA_Y')}
+
+    del bus.reads[:]
+    bus.regs[0x13:0x15] = [0x56, 0x78]
+    assert sample(device) == 0x5678
+    assert bus.reads == [(0x10, 5)]
+
+
+def test_prefetch_consumed_once(bus, device):
+    device.enable_prefetch(plan={'STATUS': ('STATUS', 'DATA_X')})
+
+    device.get('STATUS')
+    device.get('DATA_X')
+    assert bus.reads == [(0x10, 3)]
+
+    # A second read in the same cycle goes to the device
+    device.get('DATA_X')
+    assert bus.reads[-1] == (0x11, 2)
+
+    # Writes discard prefetched values
+    device.get('STATUS')
+    device.set('DATA_X', x=5)
+    device.get('DATA_X')
+    assert bus.reads[-1] == (0x11, 2)
+
+
+def test_prefetch_frozen_and_disabled(bus, device):
+    device.enable_prefetch(threshold=2, plan={'STATUS': ('STATUS', 'DATA_X', 'DATA_Y')})
+    device.freeze_prefetch()
+
+    # Pattern changes are not learned while frozen
+    for _ in range(4):
+        device.get('STATUS')
+        device.get('CONFIG')
+    assert device.get_prefetch_plan() == {'STATUS': ('STATUS', 'DATA_X', 'DATA_Y')}
+
+    device.freeze_prefetch(False)
+    for _ in range(3):
+        device.get('STATUS')
+        device.get('CONFIG')
+    assert device.get_prefetch_plan() == {'STATUS': ('STATUS', 'CONFIG')}
+
+    device.disable_prefetch()
+    del bus.reads[:]
+    sample(device)
+    assert len(bus.reads) == 3
+
+
+def test_prefetch_plan_without_trigger(bus, device):
+    device.get('STATUS')
+    bus.regs[0x10] = 0x01
+    device.enable_prefetch(plan={'STATUS': ('DATA_X',)})
+
+    # The trigger is read along with its plan, not served from the previous value
+    assert device.get('STATUS').ready == 1
+    assert bus.reads[-1] == (0x10, 3)
+
+
+def test_prefetch_plan_unknown_register(device):
+    with pytest.raises(ValueError):
+        device.enable_prefetch(plan={'STATUS': ('DATA_Z',)})
+    with pytest.raises(ValueError):
+        device.enable_prefetch(plan={'STAT': ('DATA_X',)})
+    assert device.get_prefetch_plan() == {}
+
+
+def test_prefetch_discarded_by_any_write(bus, device):
+    device.enable_prefetch(plan={'STATUS': ('STATUS', 'DATA_X')})
+    device.get('STATUS')
+
+    # Writing a register outside the plan may change the prefetched ones, eg: clearing a flag
+    device.set('CONFIG', mode=1)
+    device.get('DATA_X')
+    assert bus.reads[-1] == (0x11, 2)
+
+
+def test_prefetch_skips_locked(bus, device):
+    device.enable_prefetch(plan={'STATUS': ('STATUS', 'CONFIG')})
+
+    with device.CONFIG as config:
+        config.set_mode(7)
+        device.get('STATUS')
+        assert bus.reads[-1] == (0x10, 1)
+        config.write()
+    assert bus.regs[0x20] == 7
+
+
+def test_prefetch_invalid_threshold(device):
+    with pytest.raises(ValueError):
+        device.enable_prefetch(threshold=0)
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from i2cdevice import Bank, BitField, Device, Register
+from i2cdevice.adapter import LookupAdapter
+
+REGISTERS = (
+    Register('CONFIG1', 0x00, fields=(
+        BitField('mode', 0b00000011, adapter=LookupAdapter({'off': 0, 'single': 1, 'continuous': 2})),
+        BitField('enable', 0b10000000),
+    )),
+    Register('CONFIG2', 0x01, fields=(
+        BitField('rate', 0xFF),
+    ), volatile=False),
+    Register('THRESHOLD', 0x02, fields=(
+        BitField('threshold', 0xFFFF),
+    ), bit_width=16, volatile=False),
+    Register('CONFIG3', 0x04, fields=(
+        BitField('gain', 0x0F),
+    )),
+    Register('DATA', 0x10, fields=(
+        BitField('data', 0xFFFF),
+    ), bit_width=16, read_only=True),
+)
+
+
+@pytest.fixture()
+def device(bus):
+    return Device(0x00, i2c_dev=bus, registers=REGISTERS)
+
+
+def test_export_profile(bus, device):
+    bus.regs[0x00:0x05] = [0b10000010, 50, 0x12, 0x34, 3]
+
+    profile = device.export_profile()
+
+    assert profile == {
+        'CONFIG1': {'mode': 'continuous', 'enable': 1},
+        'CONFIG2': {'rate': 50},
+        'THRESHOLD': {'threshold': 0x1234},
+        'CONFIG3': {'gain': 3},
+    }
+    assert bus.reads == [(0x00, 5)]
+    assert json.loads(json.dumps(profile)) == profile
+
+
+def test_apply_profile_diff(bus, device):
+    profile = device.export_profile()
+    assert bus.writes == []
+
+    assert device.apply_profile(profile) == []
+    assert bus.writes == []
+
+    profile['CONFIG1']['mode'] = 'single'
+    profile['CONFIG3']['gain'] = 7
+    assert device.apply_profile(profile) == ['CONFIG1', 'CONFIG3']
+
+    # One coalesced write, bridging the unchanged registers in between
+    assert bus.writes == [(0x00, [0x01, 0x00, 0x00, 0x00, 0x07])]
+    assert bus.regs[0:5] == [0x01, 0x00, 0x00, 0x00, 0x07]
+
+
+def test_apply_profile_bridges_current_values(bus):
+    registers = (
+        Register('CONFIG', 0x00, fields=(BitField('mode', 0xFF),)),
+        Register('STATUS', 0x01, fields=(
+            BitField('ready', 0x01, read_only=True),
+            BitField('irq', 0x80),
+        )),
+        Register('GAIN', 0x02, fields=(BitField('gain', 0xFF),)),
+    )
+    device = Device(0x00, i2c_dev=bus, registers=registers)
+    device.read_registers(['CONFIG', 'STATUS', 'GAIN'])
+    bus.regs[0x01] = 0x01
+    del bus.writes[:]
+
+    # STATUS may have changed since it was read, so it is not rewritten with its old value
+    device.apply_profile({'CONFIG': {'mode': 1}, 'STATUS': {'irq': 0}, 'GAIN': {'gain': 2}})
+    assert bus.writes == [(0x00, [1]), (0x02, [2])]
+    assert bus.regs[0x01] == 0x01
+
+    # Registers read by apply_profile itself are current, so bridging them is safe
+    device = Device(0x00, i2c_dev=bus, registers=registers)
+    device.apply_profile({'CONFIG': {'mode': 3}, 'STATUS': {'irq': 0}, 'GAIN': {'gain': 4}})
+    assert bus.writes[-1] == (0x00, [3, 0x01, 4])
+
+    with pytest.raises(ValueError):
+        device.apply_profile({'STATUS': {'ready': 0}})
+
+
+def test_apply_profile_reads_unknown(bus, device):
+    bus.regs[0x01] = 99
+
+    device.apply_profile({'CONFIG3': {'gain': 2}})
+    assert bus.reads == [(0x04, 1)]
+    assert bus.writes == [(0x04, [2])]
+    assert device.get('CONFIG2').rate == 99
+
+
+def test_bursts_grouped_by_bank(bus):
+    device = Device(0x00, i2c_dev=bus, registers=(
+        Register('BANK', 0x7F, fields=(BitField('bank', 0xFF),)),
+        Register('A0', 0x10, fields=(BitField('a', 0xFF),), bank=Bank('BANK', 0)),
+        Register('A1', 0x11, fields=(BitField('a', 0xFF),), bank=Bank('BANK', 0)),
+        Register('B0', 0x10, fields=(BitField('b', 0xFF),), bank=Bank('BANK', 1)),
+        Register('B1', 0x11, fields=(BitField('b', 0xFF),), bank=Bank('BANK', 1)),
+    ))
+
+    device.set('BANK', bank=1)
+    del bus.writes[:]
+    del bus.reads[:]
+
+    device.read_registers(['A0', 'B0', 'A1', 'B1'])
+
+    # The already selected bank is read first, so only one switch is needed
+    assert bus.reads == [(0x10, 2), (0x10, 2)]
+    assert bus.writes == [(0x7F, [0])]
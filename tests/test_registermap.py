@@ -0,0 +1,154 @@
+import json
+import os
+import pathlib
+
+import pytest
+
+from i2cdevice import Addressing, Device, MockSMBus, registermap
+from i2cdevice.registermap import load_registers, parse_registers
+
+REGISTER_MAP = {
+    'registers': [
+        {'name': 'BANK', 'address': '0x7F', 'fields': [
+            {'name': 'bank', 'mask': '0xFF'},
+        ]},
+        {'name': 'ALS_CONTROL', 'address': '0x80', 'fields': [
+            {'name': 'gain', 'mask': '0b00011100', 'adapter': {'type': 'lookup', 'table': [[1, 0], [2, 1], [4, 2]]}},
+            {'name': 'sw_reset', 'bit': 1},
+            {'name': 'mode', 'bit': 0},
+        ]},
+        {'name': 'TEMPERATURE', 'address': 0x10, 'bit_width': 16, 'read_only': True, 'bank': {'register': 'BANK', 'value': 1}, 'fields': [
+            {'name': 'temperature', 'mask': '0xFFFF', 'adapter': {'type': 'chain', 'adapters': [
+                {'type': 'little_endian', 'length': 2},
+                {'type': 'twos_complement', 'bit_width': 16},
+                {'type': 'scale', 'scale': 0.01},
+            ]}},
+        ]},
+    ]
+}
+
+
+def write_map(tmp_path, data=REGISTER_MAP):
+    path = tmp_path / 'device.json'
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_load_registers(tmp_path):
+    registers = load_registers(write_map(tmp_path))
+    bus = MockSMBus(1)
+    bus.regs[0x10:0x12] = [0x18, 0xFC]
+    device = Device(0x23, i2c_dev=bus, registers=registers)
+
+    device.set('ALS_CONTROL', gain=4, mode=1)
+    assert bus.regs[0x80] == 0b00001001
+    assert device.get('ALS_CONTROL') == (4, 1, 0)
+
+    assert device.get('TEMPERATURE').temperature == -10.0
+    assert bus.regs[0x7F] == 1
+
+
+def test_load_registers_cached(tmp_path, monkeypatch):
+    path = write_map(tmp_path)
+    load_registers(path)
+    assert os.path.exists(registermap._cache_path(path))
+
+    def fail(*args):
+        raise AssertionError("source should not be parsed")
+
+    monkeypatch.setattr(registermap, 'parse_registers', fail)
+    registers = load_registers(path)
+    assert [register.name for register in registers] == ['BANK', 'ALS_CONTROL', 'TEMPERATURE']
+    assert registers[1].fields['gain'].shift == 2
+    assert registers[1].namedtuple._fields == ('gain', 'mode', 'sw_reset')
+
+    # Changing the source invalidates the cache
+    data = dict(REGISTER_MAP, registers=REGISTER_MAP['registers'][:2])
+    write_map(tmp_path, data)
+    with pytest.raises(AssertionError):
+        load_registers(path)
+    monkeypatch.undo()
+    assert len(load_registers(path)) == 2
+
+
+def test_load_registers_cache_format(tmp_path, monkeypatch):
+    path = write_map(tmp_path)
+    load_registers(path)
+
+    # A cache written with an older layout of Register/BitField is rebuilt, not unpickled
+    monkeypatch.setattr(registermap, 'CACHE_FORMAT', registermap.CACHE_FORMAT + 1)
+    calls = []
+    parse = registermap.parse_registers
+    monkeypatch.setattr(registermap, 'parse_registers', lambda *args: calls.append(args) or parse(*args))
+    assert len(load_registers(path)) == 3
+    assert len(calls) == 1
+    load_registers(path)
+    assert len(calls) == 1
+
+
+def test_load_registers_path(tmp_path):
+    path = pathlib.Path(write_map(tmp_path))
+    assert len(load_registers(path)) == 3
+    assert len(load_registers(path)) == 3
+
+
+def test_load_registers_toml(tmp_path):
+    pytest.importorskip('tomllib')
+    path = tmp_path / 'device.toml'
+    path.write_text('''
+[[registers]]
+name = "CONFIG"
+address = 0x01
+
+[[registers.fields]]
+name = "rate"
+mask = 0xF0
+adapter = { type = "lookup", table = { slow = 0, fast = 1 } }
+''')
+    registers = load_registers(str(path), cache=False)
+    device = Device(0x23, i2c_dev=MockSMBus(1), registers=registers)
+    device.set('CONFIG', rate='fast')
+    assert device.get('CONFIG').rate == 'fast'
+
+
+def test_register_addressing(tmp_path):
+    path = write_map(tmp_path, {'registers': [
+        {'name': 'OUT_X', 'address': '0x28', 'bit_width': 16, 'addressing': {'endianness': 'little'}, 'fields': [
+            {'name': 'x', 'mask': '0xFFFF'},
+        ]},
+        {'name': 'OUT_Y', 'address': '0x2A', 'bit_width': 16, 'fields': [
+            {'name': 'y', 'mask': '0xFFFF'},
+        ]},
+    ]})
+    load_registers(path)
+    registers = load_registers(path)
+    assert registers[0].addressing == Addressing(endianness='little')
+    assert registers[1].addressing is None
+
+    bus = MockSMBus(1)
+    bus.regs[0x28:0x2C] = [0x34, 0x12, 0x56, 0x78]
+    device = Device(0x1D, i2c_dev=bus, registers=registers)
+    assert device.get('OUT_X').x == 0x1234
+    assert device.get('OUT_Y').y == 0x5678
+
+
+@pytest.mark.parametrize('registers', [
+    [{'name': 'A', 'address': 0, 'fields': [{'name': 'a', 'mask': 0x100}]}],
+    [{'name': 'A', 'address': 0, 'fields': [{'name': 'a', 'mask': 0x0F}, {'name': 'b', 'mask': 0x18}]}],
+    [{'name': 'A', 'address': 0, 'fields': []}, {'name': 'A', 'address': 1, 'fields': []}],
+    [{'name': 'A', 'address': 0, 'bank': {'register': 'B', 'value': 1}, 'fields': []}],
+    [{'name': 'A', 'address': 0, 'bank': {'value': 1}, 'fields': []}],
+    [{'name': 'A', 'address': 0, 'bank': 'BANK', 'fields': []}],
+    ['A'],
+    [{'name': 'A', 'address': 0, 'fields': ['a']}],
+    [{'name': 'A', 'address': 'zero', 'fields': []}],
+    [{'name': 'A', 'address': 0, 'colour': 'red', 'fields': []}],
+    [{'name': 'A', 'address': 0, 'addressing': {'endianness': 'middle'}, 'fields': []}],
+    [{'name': 'A', 'address': 0, 'addressing': {'stride': 2}, 'fields': []}],
+    [{'name': 'A', 'address': 0, 'addressing': 'little', 'fields': []}],
+    [{'name': 'A', 'address': 0, 'fields': [{'name': 'a', 'mask': 0x0F, 'adapter': {'type': 'magic'}}]}],
+    [{'name': 'A', 'address': 0, 'fields': [{'name': 'a', 'mask': 0x0F, 'adapter': {'type': 'scale', 'factor': 2}}]}],
+])
+def test_parse_registers_invalid(registers):
+    with pytest.raises(ValueError):
+        parse_registers({'registers': registers})
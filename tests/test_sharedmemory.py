@@ -0,0 +1,140 @@
+import struct
+
+import pytest
+
+from i2cdevice import BitField, Device, Register, sharedmemory
+from i2cdevice.adapter import ChainAdapter, LookupAdapter, TwosComplementAdapter
+
+pytest.importorskip('multiprocessing.shared_memory')
+
+
+REGISTERS = (
+    Register('STATUS', 0x00, fields=(
+        BitField('ready', 0b00000001),
+        BitField('count', 0b11110000),
+    )),
+    Register('TEMPERATURE', 0x01, fields=(
+        BitField('temperature', 0xFFFF, adapter=TwosComplementAdapter(16)),
+    ), bit_width=16),
+)
+
+
+@pytest.fixture()
+def device(bus):
+    return Device(0x00, i2c_dev=bus, registers=REGISTERS)
+
+
+@pytest.fixture()
+def publisher(device):
+    publisher = sharedmemory.SamplePublisher(device, ['STATUS', 'TEMPERATURE'], capacity=4)
+    yield publisher
+    publisher.unlink()
+
+
+def test_publish_fields(bus, publisher):
+    reader = sharedmemory.SampleReader(publisher.name)
+    assert reader.names == ('timestamp', 'STATUS.ready', 'STATUS.count', 'TEMPERATURE.temperature')
+    assert reader.format == '<dBBH'
+    assert reader.latest() is None
+
+    bus.regs[0:3] = [0b01010001, 0xFF, 0xFE]
+    assert publisher.publish() == 0
+    assert reader.count == 1
+
+    index, values = reader.latest()
+    assert index == 0
+    assert values[1:] == (1, 5, 0xFFFE)
+    reader.close()
+
+
+def test_publish_modes(bus, device):
+    bus.regs[0:3] = [0b01010001, 0xFF, 0xFE]
+
+    raw = sharedmemory.SamplePublisher(device, ['STATUS', 'TEMPERATURE'], mode='raw')
+    decoded = sharedmemory.SamplePublisher(device, ['STATUS', 'TEMPERATURE'], mode='decoded')
+    try:
+        raw.publish()
+        decoded.publish()
+        for publisher, expected in ((raw, (0b01010001, 0xFFFE)), (decoded, (1.0, 5.0, -2.0))):
+            reader = sharedmemory.SampleReader(publisher.name)
+            assert reader.read(0)[1:] == expected
+            reader.close()
+    finally:
+        raw.unlink()
+        decoded.unlink()
+
+    with pytest.raises(ValueError):
+        sharedmemory.SamplePublisher(device, ['STATUS'], mode='pickled')
+
+
+def test_invalid_publisher(bus):
+    device = Device(0x00, i2c_dev=bus, registers=(
+        Register('CONFIG', 0x00, fields=(
+            BitField('mode', 0x03, adapter=LookupAdapter({'sleep': 0, 'active': 1})),
+            BitField('rate', 0x0C, adapter=ChainAdapter(LookupAdapter({'slow': 0, 'fast': 1}))),
+            BitField('gain', 0x30, adapter=LookupAdapter({1: 0, 2: 1, 4: 2})),
+        )),
+    ))
+
+    # Fields which decode to strings can't be published as floats
+    with pytest.raises(ValueError):
+        sharedmemory.SamplePublisher(device, ['CONFIG'], mode='decoded')
+
+    with pytest.raises(ValueError):
+        sharedmemory.SamplePublisher(device, ['CONFIG'], capacity=1)
+
+
+def test_invalid_values(publisher):
+    reader = sharedmemory.SampleReader(publisher.name)
+    publisher.write([0.0, 1, 2, 3])
+    with pytest.raises(ValueError):
+        publisher.write([0.0, 'ready', 2, 3])
+
+    # The failed sample was never started, so the previous one is still the latest
+    assert reader.latest() == (0, (0.0, 1, 2, 3))
+    assert reader.read(1) is None
+    publisher.write([0.0, 4, 5, 6])
+    assert reader.latest() == (1, (0.0, 4, 5, 6))
+    reader.close()
+
+
+def test_overwritten_and_torn(publisher):
+    reader = sharedmemory.SampleReader(publisher.name)
+    for value in range(6):
+        publisher.write([0.0, value, 0, 0])
+
+    # Capacity is 4, so the first two samples have been overwritten
+    assert reader.read(0) is None
+    assert reader.read(1) is None
+    assert reader.read(2)[1] == 2
+    assert reader.read(6) is None
+    assert reader.latest() == (5, (0.0, 5, 0, 0))
+
+    # A record whose stamp is odd is mid-write
+    offset = reader.header_size + (5 % reader.capacity) * reader.record_size
+    struct.pack_into('<Q', publisher.shm.buf, offset, 2 * 5 + 1)
+    assert reader.read(5) is None
+    reader.close()
+
+
+def test_records_view(publisher):
+    reader = sharedmemory.SampleReader(publisher.name)
+    publisher.write([1.5, 1, 2, 3])
+    records = reader.records()
+    assert len(records) == reader.capacity * reader.record_size
+    assert struct.unpack_from('<Q', records, 0)[0] == 2
+    assert struct.unpack_from(reader.format, records, 8) == (1.5, 1, 2, 3)
+    records.release()
+    reader.close()
+
+
+def test_as_array(publisher):
+    numpy = pytest.importorskip('numpy')
+    reader = sharedmemory.SampleReader(publisher.name)
+    publisher.write([1.5, 1, 2, 3])
+    array = reader.as_array()
+    assert array['sequence'][0] == 2
+    assert array['TEMPERATURE.temperature'][0] == 3
+    assert isinstance(array, numpy.ndarray)
+    del array
+    reader.close()
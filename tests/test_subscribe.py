@@ -0,0 +1,63 @@
+import pytest
+
+from i2cdevice import BitField, BitFlag, Device, Register
+
+REGISTERS = (
+    Register('STATUS', 0x00, fields=(
+        BitFlag('ready', 0),
+        BitFlag('overflow', 1),
+        BitField('count', 0b11110000),
+    )),
+    Register('DATA', 0x01, fields=(
+        BitField('data', 0xFF),
+    )),
+)
+
+
+@pytest.fixture()
+def device(bus):
+    return Device(0x00, i2c_dev=bus, registers=REGISTERS)
+
+
+def test_subscribe_deltas(bus, device):
+    changes = []
+
+    device.subscribe('STATUS', ['ready', 'overflow'], lambda register, fields: changes.append((register, fields)))
+
+    device.get('STATUS')
+    assert changes == [('STATUS', {'ready': 0, 'overflow': 0})]
+
+    # Unwatched field changes are ignored
+    bus.regs[0] = 0b01010000
+    device.get('STATUS')
+    device.get_field('STATUS', 'count')
+    assert len(changes) == 1
+
+    bus.regs[0] = 0b01010001
+    device.get('STATUS')
+    assert changes[-1] == ('STATUS', {'ready': 1})
+
+    bus.regs[0] = 0b01010010
+    device.get('STATUS')
+    assert changes[-1] == ('STATUS', {'ready': 0, 'overflow': 1})
+    assert len(changes) == 3
+
+
+def test_subscribe_all_fields_and_unsubscribe(bus, device):
+    changes = []
+
+    def callback(register, fields):
+        changes.append(fields)
+
+    device.subscribe('DATA', None, callback)
+    device.read_registers(['STATUS', 'DATA'])
+    assert changes == [{'data': 0}]
+
+    bus.regs[1] = 42
+    device.get('DATA')
+    assert changes[-1] == {'data': 42}
+
+    device.unsubscribe('DATA', callback)
+    bus.regs[1] = 43
+    device.get('DATA')
+    assert len(changes) == 2